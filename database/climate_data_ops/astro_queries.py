@@ -10,6 +10,31 @@ from database.climate_data_ops.base_query_strategy import BaseQuery
 
 logger = LogHelper.get_logger(__name__)
 
+# Read-only lookups used by the light scheduler, composed once at import.
+_SQL_SUNRISE_SUNSET = sql.SQL("""
+    SELECT sunrise, sunset
+    FROM public.climate_astro_data
+    WHERE location_id = %s AND forecast_date = %s;
+""")
+_SQL_LATEST_SUNRISE_SUNSET = sql.SQL("""
+    SELECT sunrise, sunset
+    FROM public.climate_astro_data
+    WHERE location_id = %s
+    ORDER BY forecast_date DESC
+    LIMIT 1;
+""")
+# sunrise/sunset are stored as 12-hour strings; cast them to TIME so callers get datetime.time
+_SQL_SUNRISE_SUNSET_OR_LATEST = sql.SQL("""
+    SELECT
+        trim(split_part(sunrise, chr(9), 1))::time AS sunrise,
+        trim(split_part(sunset, chr(9), 1))::time AS sunset,
+        forecast_date, (forecast_date = %s) AS is_requested_date
+    FROM public.climate_astro_data
+    WHERE location_id = %s
+    ORDER BY (forecast_date = %s) DESC, forecast_date DESC
+    LIMIT 1;
+""")
+
 
 class AstroQueries(BaseQuery):
     """
@@ -185,14 +210,9 @@ class AstroQueries(BaseQuery):
         :param forecast_date: The date (YYYY-MM-DD) of the forecast.
         :return: A dictionary with 'sunrise' and 'sunset' times if found, None otherwise.
         """
-        query = sql.SQL("""
-            SELECT sunrise, sunset
-            FROM public.climate_astro_data
-            WHERE location_id = %s AND forecast_date = %s;
-        """)
         params = (location_id, forecast_date)
         try:
-            result = self.db_ops.execute_query(query, params, fetch_one=True)
+            result = self.db_ops.execute_query(_SQL_SUNRISE_SUNSET, params, fetch_one=True)
             if result:
                 logger.info(f"Sunrise/sunset found for location ID {location_id}, date '{forecast_date}'.")
                 return {'sunrise': result.get('sunrise'), 'sunset': result.get('sunset')}
@@ -209,13 +229,32 @@ class AstroQueries(BaseQuery):
         """
         Fetches the latest available sunrise/sunset data from the table.
         """
-        query = """
-            SELECT sunrise, sunset 
-            FROM climate_astro_data 
-            WHERE location_id = %s
-            ORDER BY forecast_date DESC 
-            LIMIT 1;
-        """
         params = (location_id,)
-        result = self.db_ops.execute_query(query, params, fetch_one=True)
-        return result
\ No newline at end of file
+        result = self.db_ops.execute_query(_SQL_LATEST_SUNRISE_SUNSET, params, fetch_one=True)
+        return result
+
+    def get_sunrise_sunset_or_latest(self, location_id: int, forecast_date: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves sunrise and sunset for a location and date, falling back to the latest
+        available record for that location, in a single query.
+
+        :param location_id: The ID of the location.
+        :param forecast_date: The preferred date (YYYY-MM-DD) of the forecast.
+        :return: A dictionary with 'sunrise' and 'sunset' as :class:`datetime.time`, 'forecast_date'
+                 and 'is_requested_date' (True when the row is for ``forecast_date``), or None if
+                 the location has no data.
+        """
+        params = (forecast_date, location_id, forecast_date)
+        try:
+            result = self.db_ops.execute_query(_SQL_SUNRISE_SUNSET_OR_LATEST, params, fetch_one=True)
+            if result:
+                logger.info(f"Sunrise/sunset found for location ID {location_id} (requested '{forecast_date}', using '{result.get('forecast_date')}').")
+                return result
+            logger.info(f"No sunrise/sunset data found for location ID {location_id}.")
+            return None
+        except psycopg2.Error as e:
+            logger.error(f"Database error retrieving sunrise/sunset for location ID {location_id}, date '{forecast_date}': {e}", exc_info=True)
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving sunrise/sunset for location ID {location_id}, date '{forecast_date}': {e}", exc_info=True)
+            return None
@@ -1,6 +1,7 @@
 # vivarium/database/data_loader/pgdump_data_loader.py
 import os, sys
 import subprocess
+from collections import deque
 from typing import Optional
 
 from utilities.src.logger import LogHelper
@@ -11,6 +12,9 @@ from database.data_loader_ops.data_loader_strategy import DataLoaderStrategy
 
 logger = LogHelper.get_logger(__name__)
 
+#: Number of trailing psql output lines kept for the error report on failure.
+PSQL_OUTPUT_TAIL_LINES = 50
+
 class PGDumpDataLoader(DataLoaderStrategy):
     """
     Concrete pgdump data loading strategy for ingesting data into a PostgreSQL database
@@ -124,28 +128,30 @@ class PGDumpDataLoader(DataLoaderStrategy):
                     f"{' '.join(command[:-1])} < {os.path.basename(self.file_path)}")
         
         try:
-            # Use subprocess.run for cleaner handling and error checking
-            process = subprocess.run(
+            # Stream psql output line by line (stderr merged into stdout) instead of buffering it all;
+            # a large dump can print many thousands of lines and the single pipe cannot fill up and stall psql.
+            output_tail = deque(maxlen=PSQL_OUTPUT_TAIL_LINES)
+            with subprocess.Popen(
                 command,
-                capture_output=True,  # Capture stdout and stderr
-                text=True,            # Decode stdout/stderr as text
-                check=False,          # Do not raise CalledProcessError automatically
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
                 env=env_with_password # Pass the environment with PGPASSWORD
-            )
-
-            if process.returncode != 0:
+            ) as process:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        output_tail.append(line)
+                        logger.debug("PSQL: %s", line)
+                returncode = process.wait()
+
+            if returncode != 0:
                 logger.error(f"PGDumpDataLoader: Failed to load dump file '{self.file_path}'. "
-                             f"Psql exited with code {process.returncode}.")
-                logger.error(f"PSQL STDOUT:\n{process.stdout.strip()}")
-                logger.error(f"PSQL STDERR:\n{process.stderr.strip()}")
+                             f"Psql exited with code {returncode}.")
+                logger.error("PSQL OUTPUT (last %d lines):\n%s", len(output_tail), '\n'.join(output_tail))
                 return False
             else:
                 logger.info(f"PGDumpDataLoader: Successfully loaded data from dump file '{self.file_path}'.")
-                # Log psql output at debug level if it exists, even on success
-                if process.stdout.strip():
-                    logger.debug(f"PSQL STDOUT (success):\n{process.stdout.strip()}")
-                if process.stderr.strip():
-                    logger.debug(f"PSQL STDERR (success):\n{process.stderr.strip()}")
                 return True
         except FileNotFoundError:
             logger.critical("PGDumpDataLoader: 'psql' command not found. "
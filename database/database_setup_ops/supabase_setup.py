@@ -20,6 +20,9 @@ from database.database_setup_ops.db_setup_strategy import DBSetupStrategy
 
 logger = LogHelper.get_logger(__name__)
 
+#: Seconds a psql run may take before it is killed, so a stalled connection cannot hang setup.
+PSQL_TIMEOUT_SECONDS: int = 600
+
 class SupabaseSetup(DBSetupStrategy):
     """
     Concrete implementation of DBSetupStrategy for Supabase PostgreSQL.
@@ -85,7 +88,9 @@ class SupabaseSetup(DBSetupStrategy):
         try:
             # check=False ensures subprocess.run doesn't raise an exception for non-zero exit codes.
             # We check result.returncode manually.
-            result = subprocess.run(command, env=env, check=False, capture_output=True, text=True)
+            # On timeout, subprocess.run kills and reaps psql before raising TimeoutExpired.
+            result = subprocess.run(command, env=env, check=False, capture_output=True, text=True,
+                                    timeout=PSQL_TIMEOUT_SECONDS)
 
             if result.returncode == 0:
                 logger.info("psql command executed successfully.")
@@ -105,6 +110,9 @@ class SupabaseSetup(DBSetupStrategy):
                 "installed and accessible in your system's PATH. On Debian/Ubuntu, install 'postgresql-client'."
             )
             return False
+        except subprocess.TimeoutExpired:
+            logger.error(f"psql command did not finish within {PSQL_TIMEOUT_SECONDS} seconds and was terminated.")
+            return False
         except Exception as e:
             logger.critical(f"An unexpected error occurred while running psql command: {e}", exc_info=True)
             return False
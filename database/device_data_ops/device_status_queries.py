@@ -106,18 +106,20 @@ class DeviceStatusQueries:
     def get_latest_status_by_device_id(self, device_id: str) -> Optional[Dict]:
         """Retrieves the latest device status information for a given device_id.
 
+        Runs as a server-side prepared statement, since every device toggle reads it.
+
         :param device_id: The ID of the device.
         :type device_id: int
         :returns: A dictionary representing the latest device status, or ``None`` if not found.
         :rtype: Optional[Dict]
         """
-        query = """
+        statement = """
             SELECT status_id, device_id, timestamp, is_on, device_data
             FROM public.device_status
-            WHERE device_id = %s
+            WHERE device_id = $1
             ORDER BY timestamp DESC
-            LIMIT 1;
+            LIMIT 1
         """
         params = (int(device_id),)
-        results = self.db_ops.execute_query(query, params, fetch_one=True)
+        results = self.db_ops.execute_prepared('device_latest_status', statement, params, fetch_one=True)
         return results
\ No newline at end of file
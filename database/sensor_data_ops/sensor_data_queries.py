@@ -1,7 +1,7 @@
 # vivarium/terrarium/src/database/sensor_data_queries.py
 
 import json
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from utilities.src.db_operations import DBOperations
 
 class SensorDataQueries:
@@ -39,18 +39,19 @@ class SensorDataQueries:
         :returns: The ID of the newly inserted reading, or ``None`` on failure.
         :rtype: Optional[int]
         """
-        query = """
+        # Issued on every scheduled sensor read, so it runs as a server-side prepared statement
+        statement = """
             INSERT INTO public.sensor_readings (sensor_id, timestamp, raw_data)
-            VALUES (%s, %s, %s)
-            RETURNING reading_id;
+            VALUES ($1, $2, $3)
+            RETURNING reading_id
         """
         params = (sensor_id, timestamp, json.dumps(raw_data) if raw_data else None)
 
         try:
             self.db_ops.begin_transaction()
-            result = self.db_ops.execute_query(query, params, fetch_one=True)
+            reading_id = self.db_ops.execute_prepared('sensor_insert_reading', statement, params, scalar=True)
             self.db_ops.commit_transaction()
-            return result['reading_id'] if result else None
+            return reading_id
         except Exception:
             self.db_ops.rollback_transaction()
             raise
@@ -95,6 +96,65 @@ class SensorDataQueries:
         result = self.db_ops.execute_query(query, params, fetch_one=True)
         return result
 
+    def get_latest_humidity(self, sensor_id: int) -> Optional[float]:
+        """Retrieves only the humidity percentage of the latest reading for a sensor.
+
+        The value is extracted from ``raw_data`` by the database, so the JSON document
+        is neither transferred nor decoded in Python. ``raw_data`` may hold either a
+        JSON object or a JSON-encoded string of one; both forms are handled.
+        The query runs as a server-side prepared statement since it is issued on every
+        humidity check.
+
+        :param sensor_id: The ID of the sensor.
+        :type sensor_id: int
+        :returns: The latest humidity percentage, or ``None`` if there is no reading or it has no humidity value.
+        :rtype: Optional[float]
+        """
+        statement = """
+            SELECT ((raw_data #>> '{}')::jsonb ->> 'humidity_percentage')::float AS humidity_percentage
+            FROM public.sensor_readings
+            WHERE sensor_id = $1
+            ORDER BY timestamp DESC
+            LIMIT 1
+        """
+        params = (sensor_id,)
+        return self.db_ops.execute_prepared('sensor_latest_humidity', statement, params, scalar=True)
+
+    def get_latest_humidity_and_status(self, sensor_id: int, device_id: int) -> Tuple[Optional[float], Optional[Dict]]:
+        """Retrieves a sensor's latest humidity and a device's latest status in one round-trip.
+
+        :param sensor_id: The ID of the humidity sensor.
+        :type sensor_id: int
+        :param device_id: The ID of the device whose status is wanted.
+        :type device_id: int
+        :returns: The latest humidity percentage (or ``None``) and the latest device status row
+                  as a dictionary (or ``None`` if the device has no status yet).
+        :rtype: Tuple[Optional[float], Optional[Dict]]
+        """
+        query = """
+            SELECT
+                (SELECT ((raw_data #>> '{}')::jsonb ->> 'humidity_percentage')::float
+                 FROM public.sensor_readings
+                 WHERE sensor_id = %s
+                 ORDER BY timestamp DESC
+                 LIMIT 1) AS humidity_percentage,
+                ds.status_id, ds.device_id, ds.timestamp, ds.is_on, ds.device_data
+            FROM (SELECT 1) AS one
+            LEFT JOIN LATERAL (
+                SELECT status_id, device_id, timestamp, is_on, device_data
+                FROM public.device_status
+                WHERE device_id = %s
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) AS ds ON TRUE;
+        """
+        params = (sensor_id, int(device_id))
+        result = self.db_ops.execute_query(query, params, fetch_one=True)
+        if not result:
+            return None, None
+        humidity = result.pop('humidity_percentage')
+        return humidity, (result if result['status_id'] is not None else None)
+
     def get_readings_by_time_range(self, start_time: str, end_time: str) -> Optional[List[Dict]]:
         """Retrieves sensor readings within a specified time range.
 
@@ -1,11 +1,15 @@
 import os
 import sys
 import ssl
+import socket
 import time
 import json
+import logging
+import queue
 import random
+import collections
+import multiprocessing
 import paho.mqtt.client as mqtt
-from datetime import datetime
 
 # Adjust vivarium_path based on the actual file location
 # Assuming this file is in vivarium/mqtt/src/
@@ -15,6 +19,32 @@ if vivarium_path not in sys.path:
 
 # Import your MQTTConfig class
 from utilities.src.config import MQTTConfig
+from utilities.src.logger import LogHelper
+
+logger = LogHelper.get_logger(__name__)
+
+#: MQTT settings, read once at import time.
+mqtt_settings = MQTTConfig().snapshot()
+
+#: Number of sensor samples accumulated before a batch is published.
+BATCH_SIZE = 10
+#: Seconds between simulated sensor samples.
+SAMPLE_INTERVAL_SECONDS = 1
+#: QoS for loss-tolerant sensor telemetry (no PUBACK round-trip).
+TELEMETRY_QOS = 0
+#: QoS for the command channel, where delivery must be acknowledged.
+COMMAND_QOS = 1
+#: Maximum number of unprocessed messages kept by the default message handler.
+INBOUND_QUEUE_SIZE = 1024
+#: Number of simulated readings pre-generated for the demo loop.
+SIMULATED_SAMPLE_POOL = 10_000
+#: Seconds the publisher process waits on its queue before servicing the network.
+PUBLISHER_POLL_INTERVAL = 0.1
+#: Bounds (seconds) of the doubling delay between reconnect attempts in :meth:`VivariumMqttClient.serve_queue`.
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 120
+#: ``loop()`` return codes meaning the session is gone and must be re-established.
+_DISCONNECTED_RCS = (mqtt.MQTT_ERR_NO_CONN, mqtt.MQTT_ERR_CONN_LOST)
 
 class VivariumMqttClient:
     """
@@ -29,18 +59,22 @@ class VivariumMqttClient:
         Args:
             on_message_callback (callable, optional): A function to call when a message is received.
                                                     It should accept (client, userdata, msg) as arguments.
-                                                    If None, a default print handler is used.
+                                                    If None, messages are queued for :meth:`drain_inbound`.
             client_id (str): A unique client ID for the MQTT connection.
         """
-        self.config = MQTTConfig() # Instance of your MQTTConfig class
+        # Load MQTT details from the module-level settings snapshot
+        self.broker = mqtt_settings.broker
+        self.port = mqtt_settings.port
+        self.username = mqtt_settings.username
+        self.password = mqtt_settings.password
+        self.data_topic = mqtt_settings.data_topic
+        self.command_topic = mqtt_settings.command_topic
+
+        # Messages received by the default handler, drained with drain_inbound()
+        self._inbound = collections.deque(maxlen=INBOUND_QUEUE_SIZE)
 
-        # Load MQTT details from config
-        self.broker = self.config.get('MQTT_BROKER')
-        self.port = self.config.get('MQTT_PORT')
-        self.username = self.config.get('MQTT_USERNAME')
-        self.password = self.config.get('MQTT_PASSWORD')
-        self.data_topic = self.config.get('DATA_TOPIC')
-        self.command_topic = self.config.get('COMMAND_TOPIC')
+        # Reused by publish_sensor_data so a new payload dict is not allocated per publish
+        self._sensor_buf = {"ts_ns": 0, "temperature": 0.0, "humidity": 0.0, "location_lat": 0.0, "location_lon": 0.0}
 
         self.client_id = client_id
         self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION1, self.client_id)
@@ -51,69 +85,187 @@ class VivariumMqttClient:
 
         # Assign internal callback methods
         self.client.on_connect = self._on_connect
+        self.client.on_socket_open = self._on_socket_open
         self.client.on_message = on_message_callback if on_message_callback else self._default_on_message
 
-        print(f"MQTT Client initialized for broker: {self.broker}:{self.port}")
+        logger.info(f"MQTT Client initialized for broker: {self.broker}:{self.port}")
 
     def _on_connect(self, client, userdata, flags, rc):
         """Internal callback for when the client connects to the broker."""
         if rc == 0:
-            print("Connected to MQTT Broker!")
+            logger.info("Connected to MQTT Broker!")
             # Subscribe to the command topic after successful connection
-            client.subscribe(self.command_topic)
-            print(f"Subscribed to topic: {self.command_topic}")
+            client.subscribe(self.command_topic, qos=COMMAND_QOS)
+            logger.info(f"Subscribed to topic: {self.command_topic}")
         else:
-            print(f"Failed to connect, return code {rc}\n")
+            logger.error(f"Failed to connect, return code {rc}")
+
+    def _on_socket_open(self, client, userdata, sock):
+        """
+        Internal callback for when the network socket is opened, before the first packet is sent.
+
+        Disables Nagle's algorithm so small PUBLISH frames are sent immediately
+        instead of being coalesced, and enables quick ACKs where the platform supports it.
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"Could not set TCP options on MQTT socket: {e}")
 
     def _default_on_message(self, client, userdata, msg):
-        """Default message handler if no custom callback is provided."""
-        print(f"Received message on topic: {msg.topic} - Payload: {msg.payload.decode()}")
-        # You can add a basic command interpretation here if you want
-        # or rely entirely on the external on_message_callback
+        """
+        Default message handler if no custom callback is provided.
+
+        Only enqueues the message so the paho network loop is never held up by
+        per-message work; use :meth:`drain_inbound` to process queued messages.
+        """
+        self._inbound.append(msg)
+
+    def drain_inbound(self) -> list:
+        """
+        Removes and returns all messages queued by the default message handler.
+
+        Returns:
+            list: The queued :class:`paho.mqtt.client.MQTTMessage` objects, oldest first.
+        """
+        messages = []
+        while self._inbound:
+            messages.append(self._inbound.popleft())
+        if messages and logger.isEnabledFor(logging.DEBUG):
+            for msg in messages:
+                logger.debug(f"Received message on topic: {msg.topic} - Payload: {msg.payload.decode(errors='replace')}")
+        return messages
 
     def connect(self):
         """Attempts to connect the MQTT client to the broker."""
         try:
             self.client.connect(self.broker, self.port, 60)
-            print(f"Attempting to connect to {self.broker}:{self.port}")
+            logger.info(f"Attempting to connect to {self.broker}:{self.port}")
         except Exception as e:
-            print(f"Connection failed: {e}")
+            logger.critical(f"Connection failed: {e}")
             sys.exit(1) # Exit if connection fails critically
 
     def start_loop(self):
         """Starts the MQTT client's network loop in a background thread."""
         self.client.loop_start()
-        print("MQTT client loop started.")
+        logger.info("MQTT client loop started.")
 
     def stop_loop(self):
         """Stops the MQTT client's network loop and disconnects."""
         self.client.loop_stop()
         self.client.disconnect()
-        print("MQTT client loop stopped and disconnected.")
+        logger.info("MQTT client loop stopped and disconnected.")
 
-    def publish_message(self, topic: str, payload: dict):
+    def serve_queue(self, outbound: multiprocessing.Queue, poll_interval: float = PUBLISHER_POLL_INTERVAL):
         """
-        Publishes a JSON message to a specified MQTT topic.
+        Runs the MQTT network loop in the calling thread, publishing payloads received on a queue.
+
+        Every pass drains all pending payloads from the queue, publishes them to the data topic
+        and then services the network once, so no separate paho loop thread is needed.
+        Because paho only reconnects by itself inside ``loop_forever``/``loop_start``, a lost
+        connection is re-established here, with a doubling delay between attempts
+        (:data:`RECONNECT_MIN_DELAY` to :data:`RECONNECT_MAX_DELAY`); ``on_connect`` then
+        subscribes to the command topic again. Returns when ``None`` is received on the queue.
+
+        Args:
+            outbound (multiprocessing.Queue): Queue of sensor payloads (dicts or lists of dicts).
+            poll_interval (float): Seconds to wait for a payload before servicing the network.
+        """
+        reconnect_delay = RECONNECT_MIN_DELAY
+        reconnect_at = 0.0
+        while True:
+            pending = []
+            try:
+                pending.append(outbound.get(timeout=poll_interval))
+                while True:
+                    pending.append(outbound.get_nowait())
+            except queue.Empty:
+                pass
+
+            for payload in pending:
+                if payload is None:
+                    return
+                self.publish_message(self.data_topic, payload, qos=TELEMETRY_QOS)
+
+            rc = self.client.loop(timeout=0)
+            if self.client.is_connected():
+                reconnect_delay = RECONNECT_MIN_DELAY
+            elif rc in _DISCONNECTED_RCS and time.monotonic() >= reconnect_at:
+                # The next attempt is spaced out even if this one opens the socket, since the
+                # broker may still refuse the CONNECT; the queue keeps draining in between.
+                delay = reconnect_delay
+                reconnect_at = time.monotonic() + delay
+                reconnect_delay = min(reconnect_delay * 2, RECONNECT_MAX_DELAY)
+                try:
+                    self.client.reconnect()
+                    logger.info("Reconnecting to MQTT broker %s:%s.", self.broker, self.port)
+                except OSError as e:
+                    logger.warning("MQTT reconnect failed: %s. Retrying in %s seconds.", e, delay)
+
+    def publish_message(self, topic: str, payload: dict | list, qos: int = TELEMETRY_QOS, retain: bool = False):
+        """
+        Publishes a JSON message (object or array) to a specified MQTT topic.
+
+        QoS is explicit so telemetry never waits on a PUBACK; pass ``COMMAND_QOS``
+        for messages on the command channel.
+
+        The payload is encoded to UTF-8 bytes once here and handed to paho as-is,
+        so it is not re-encoded inside ``publish``.
         """
         try:
-            json_payload = json.dumps(payload)
-            self.client.publish(topic, json_payload)
-            print(f"Published to {topic}: {json_payload}")
+            json_payload = json.dumps(payload).encode('utf-8')
+            self.client.publish(topic, json_payload, qos=qos, retain=retain)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Published to {topic}: {json_payload.decode('utf-8')}")
         except Exception as e:
-            print(f"Error publishing message: {e}")
+            logger.error(f"Error publishing message: {e}")
 
     def publish_sensor_data(self, temperature: float, humidity: float, location_lat: float, location_lon: float):
         """
         Publishes simulated or actual sensor data.
+
+        The payload dictionary is reused between calls and serialized immediately,
+        so callers must not keep a reference to it; use :meth:`build_sensor_sample`
+        for samples that are collected into a batch.
+        """
+        sensor_data = self._sensor_buf
+        sensor_data["ts_ns"] = time.time_ns()
+        sensor_data["temperature"] = temperature
+        sensor_data["humidity"] = humidity
+        sensor_data["location_lat"] = location_lat
+        sensor_data["location_lon"] = location_lon
+        self.publish_message(self.data_topic, sensor_data, qos=TELEMETRY_QOS)
+
+    def publish_sensor_batch(self, samples: list):
+        """
+        Publishes a batch of sensor samples as a single JSON array.
+
+        Sending several samples in one PUBLISH amortizes the framing and
+        per-message socket overhead compared to one message per sample.
+
+        Args:
+            samples (list): A list of sensor data dictionaries to publish together.
         """
-        sensor_data = {
-            "timestamp": datetime.now().isoformat(),
+        if not samples:
+            return
+        self.publish_message(self.data_topic, list(samples), qos=TELEMETRY_QOS)
+
+    @staticmethod
+    def build_sensor_sample(temperature: float, humidity: float, location_lat: float, location_lon: float) -> dict:
+        """
+        Builds a single timestamped sensor sample suitable for :meth:`publish_sensor_batch`.
+
+        The timestamp is sent as ``ts_ns``, integer nanoseconds since the Unix epoch.
+        """
+        return {
+            "ts_ns": time.time_ns(),
             "temperature": temperature,
             "humidity": humidity,
             "location_lat": location_lat,
             "location_lon": location_lon
         }
-        self.publish_message(self.data_topic, sensor_data)
 
 # --- Define your specific on_message logic here (outside the class for flexibility) ---
 def vivarium_command_handler(client, userdata, msg):
@@ -121,29 +273,68 @@ def vivarium_command_handler(client, userdata, msg):
     Handles incoming command messages for the vivarium.
     This function will be passed to the VivariumMqttClient.
     """
-    print(f"Handling command: {msg.topic} - {msg.payload.decode()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Handling command: {msg.topic} - {msg.payload.decode(errors='replace')}")
     try:
-        command = json.loads(msg.payload.decode())
-        if msg.topic == client.command_topic: # Use client's stored topic for verification
+        command = json.loads(msg.payload) # json accepts the raw payload bytes, no intermediate str
+        if msg.topic == mqtt_settings.command_topic: # paho passes its own Client here, so use the configured topic
             action = command.get("action")
             if action == "light_on":
-                print("Executing: Turn vivarium lights ON")
+                logger.info("Executing: Turn vivarium lights ON")
                 # Add your GPIO control code here for lights
             elif action == "light_off":
-                print("Executing: Turn vivarium lights OFF")
+                logger.info("Executing: Turn vivarium lights OFF")
                 # Add your GPIO control code here for lights
             elif action == "set_fan_speed":
                 speed = command.get("value")
-                print(f"Executing: Set fan speed to {speed}%")
+                logger.info(f"Executing: Set fan speed to {speed}%")
                 # Add your GPIO/PWM control code here for fan
             else:
-                print(f"Unknown command action: {action}")
+                logger.warning(f"Unknown command action: {action}")
         else:
-            print(f"Message on unexpected topic: {msg.topic}")
-    except json.JSONDecodeError:
-        print("Received non-JSON command message, skipping.")
+            logger.warning(f"Message on unexpected topic: {msg.topic}")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        logger.warning("Received non-JSON command message, skipping.")
     except Exception as e:
-        print(f"Error processing command message: {e}")
+        logger.error(f"Error processing command message: {e}")
+
+
+def _publisher_process(outbound: multiprocessing.Queue, on_message_callback=None, client_id: str = "VivariumPiPublisher"):
+    """
+    Target for the publisher process: owns the MQTT connection and its network loop.
+    """
+    publisher = VivariumMqttClient(on_message_callback=on_message_callback, client_id=client_id)
+    publisher.connect()
+    try:
+        publisher.serve_queue(outbound)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.client.disconnect()
+
+def start_publisher_process(on_message_callback=None, client_id: str = "VivariumPiPublisher"):
+    """
+    Starts the MQTT network loop in a dedicated process.
+
+    Keeping the paho loop in its own process means the side producing sensor data
+    does not contend with it for the GIL. Payloads are forwarded through the returned
+    queue; put ``None`` on it to stop the process.
+
+    Args:
+        on_message_callback (callable, optional): A module-level message handler for the command topic.
+        client_id (str): A unique client ID for the MQTT connection.
+
+    Returns:
+        tuple: The started :class:`multiprocessing.Process` and its outbound :class:`multiprocessing.Queue`.
+    """
+    outbound = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_publisher_process,
+        args=(outbound, on_message_callback, client_id),
+        daemon=True
+    )
+    process.start()
+    return process, outbound
 
 
 # --- Main execution block to demonstrate usage ---
@@ -153,32 +344,37 @@ if __name__ == "__main__":
     # For testing, remember to replace placeholders in your config or hardcode them temporarily if testing standalone.
 
     try:
-        # Create an instance of your MQTT client, passing the custom command handler
-        vivarium_client = VivariumMqttClient(on_message_callback=vivarium_command_handler)
-
-        # Connect to the MQTT broker
-        vivarium_client.connect()
-
-        # Start the background loop for sending/receiving messages
-        vivarium_client.start_loop()
+        # Run the MQTT connection and network loop in its own process, passing the custom command handler
+        publisher, outbound = start_publisher_process(on_message_callback=vivarium_command_handler)
 
         # Simulate continuous operation and data publishing
-        print("Simulating sensor data publishing. Press Ctrl+C to exit.")
+        logger.info("Simulating sensor data publishing. Press Ctrl+C to exit.")
+        # Pre-generate the simulated readings once so the loop only indexes into them
+        temperatures = [round(random.uniform(20.0, 30.0), 2) for _ in range(SIMULATED_SAMPLE_POOL)]
+        humidities = [round(random.uniform(50.0, 80.0), 2) for _ in range(SIMULATED_SAMPLE_POOL)]
+        sample_index = 0
+
+        samples = collections.deque(maxlen=BATCH_SIZE)
         while True:
             # Simulate sensor data
-            temperature = round(random.uniform(20.0, 30.0), 2)
-            humidity = round(random.uniform(50.0, 80.0), 2)
+            temperature = temperatures[sample_index]
+            humidity = humidities[sample_index]
+            sample_index = (sample_index + 1) % SIMULATED_SAMPLE_POOL
+            samples.append(VivariumMqttClient.build_sensor_sample(temperature, humidity, 5.983, 116.067))
 
-            # Publish the sensor data using the class method
-            vivarium_client.publish_sensor_data(temperature, humidity, 5.983, 116.067)
+            # Hand the accumulated samples to the publisher process once the batch is full
+            if len(samples) == BATCH_SIZE:
+                outbound.put(list(samples))
+                samples.clear()
 
-            time.sleep(10) # Publish every 10 seconds
+            time.sleep(SAMPLE_INTERVAL_SECONDS)
 
     except KeyboardInterrupt:
-        print("\nCtrl+C detected. Shutting down MQTT client.")
+        logger.info("Ctrl+C detected. Shutting down MQTT client.")
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error(f"An unexpected error occurred: {e}")
     finally:
-        if 'vivarium_client' in locals() and vivarium_client.client.is_connected():
-            vivarium_client.stop_loop()
-            print("MQTT client gracefully shut down.")
\ No newline at end of file
+        if 'publisher' in locals() and publisher.is_alive():
+            outbound.put(None)
+            publisher.join(timeout=5)
+            logger.info("MQTT client gracefully shut down.")
\ No newline at end of file
@@ -0,0 +1,17 @@
+# vivarium/scheduler/src/_pathsetup.py
+"""
+One-shot path setup for scheduler scripts started directly with ``python scheduler/src/<script>.py``.
+
+The project root is resolved once, at first import, and placed on :data:`sys.path`
+so that ``utilities.src``, ``scheduler.src`` and friends can be imported. Setting the
+``VIVARIUM_ROOT`` environment variable skips the path resolution entirely.
+"""
+
+import os
+import sys
+
+#: Absolute path to the 'vivarium' project root.
+VIVARIUM_ROOT: str = os.environ.get('VIVARIUM_ROOT') or os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+if VIVARIUM_ROOT not in sys.path:
+    sys.path.insert(0, VIVARIUM_ROOT)
@@ -1,14 +1,8 @@
 # vivarium/scheduler/src/device_scheduler_base.py
 
-import os
-import sys
+import functools
 from datetime import datetime, timedelta
-from apscheduler.schedulers.blocking import BlockingScheduler
-
-# Assuming this file is in vivarium/scheduler/src/
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+from apscheduler.schedulers.base import BaseScheduler
 
 from utilities.src.logger import LogHelper
 from utilities.src.db_operations import DBOperations
@@ -20,24 +14,38 @@ class DeviceSchedulerBase:
     A base class for scheduling device-related jobs.
     Provides common methods for interacting with APScheduler and shared resources.
     """
-    def __init__(self, scheduler: BlockingScheduler, db_operations: DBOperations):
+    def __init__(self, scheduler: BaseScheduler, db_operations: DBOperations):
         """
         Initializes the DeviceSchedulerBase.
 
         Args:
-            scheduler (BlockingScheduler): The main APScheduler instance.
+            scheduler (BaseScheduler): The main APScheduler instance (blocking, background or asyncio).
             db_operations (DatabaseOperations): The shared database operations instance.
         """
         self.scheduler = scheduler
         self.db_operations = db_operations
         logger.info(f"Initialized DeviceSchedulerBase for {self.__class__.__name__}.")
 
+    def _with_pooled_connection(self, func):
+        """
+        Wraps ``func`` so that each run holds its own pooled connection.
+
+        Jobs run on the scheduler's worker threads; outside :meth:`DBOperations.acquire`
+        their transactions would share a single connection and could commit or roll
+        back each other's writes.
+        """
+        @functools.wraps(func)
+        def run_with_connection(*args, **kwargs):
+            with self.db_operations.acquire():
+                return func(*args, **kwargs)
+        return run_with_connection
+
     def _schedule_cron_job(self, func, hour: int, minute: int, second: int, args: list, job_id: str, replace_existing: bool = True):
         """
         Helper method to schedule a cron job.
         """
         self.scheduler.add_job(
-            func,
+            self._with_pooled_connection(func),
             'cron',
             hour=hour,
             minute=minute,
@@ -53,7 +61,7 @@ class DeviceSchedulerBase:
         Helper method to schedule a date job (run once at a specific datetime).
         """
         self.scheduler.add_job(
-            func,
+            self._with_pooled_connection(func),
             'date',
             run_date=run_date,
             args=args,
@@ -67,7 +75,7 @@ class DeviceSchedulerBase:
         Helper method to schedule an interval job.
         """
         self.scheduler.add_job(
-            func,
+            self._with_pooled_connection(func),
             'interval',
             minutes=minutes,
             args=args,
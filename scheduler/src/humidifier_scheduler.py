@@ -1,16 +1,10 @@
 # vivarium/scheduler/src/humidifier_scheduler.py
 
-import os
-import sys
-import json
+import threading
 from datetime import datetime, timedelta
+import psycopg2
 
-# Adjust path as needed
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if str(vivarium_path) not in sys.path:
-    sys.path.insert(0, str(vivarium_path))
-
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from utilities.src.logger import LogHelper
 from utilities.src.config import HumidifierConfig, SensorConfig
 from utilities.src.db_operations import DBOperations
@@ -24,13 +18,19 @@ logger = LogHelper.get_logger(__name__)
 humid_config = HumidifierConfig()
 sensor_config = SensorConfig()
 
+#: Bounds (minutes) and rate (minutes per % of margin) for deferring humidity checks
+#: while the humidifier is off and humidity is comfortably above the activation point.
+CHECK_DEFER_MIN_MINUTES: float = 1
+CHECK_DEFER_MAX_MINUTES: float = 30
+CHECK_DEFER_MINUTES_PER_PERCENT: float = 0.5
+
 
 class HumidifierScheduler(DeviceSchedulerBase):
     """
     Manages the scheduling and automatic control of the vivarium humidifier.
     """
 
-    def __init__(self, scheduler: BlockingScheduler, 
+    def __init__(self, scheduler: BaseScheduler, 
                  db_operations: DBOperations, 
                  humidifier_controller: HumidifierController, 
                  aeration_controller: AerationController):
@@ -38,7 +38,7 @@ class HumidifierScheduler(DeviceSchedulerBase):
         Initializes the HumidifierScheduler.
 
         :param scheduler: The main APScheduler instance.
-        :type scheduler: BlockingScheduler
+        :type scheduler: BaseScheduler
         :param db_operations: The shared database operations instance.
         :type db_operations: DBOperations
         :param humidifier_controller: An instance of the HumidifierController.
@@ -55,8 +55,20 @@ class HumidifierScheduler(DeviceSchedulerBase):
         self.target_humidity = humid_config.target_humidity
         self.hysteresis = humid_config.hysteresis
         self.humidity_sensor_id = sensor_config.THsensorID
+        self._runtime_delta = timedelta(minutes=humid_config.runtime)
 
         self._humidifier_off_time = None
+        self._next_check_at = None
+        # Held while a check runs, so overlapping triggers skip instead of racing on the state above
+        self._check_lock = threading.Lock()
+
+        # Decision table keyed by (is_on << 1) | humidity_low; a fixed run in progress
+        # returns before the table is consulted
+        self._humidifier_actions = {
+            0b01: self._activate_humidifier,
+            0b11: self._log_humidifier_already_running,
+            0b10: self._deactivate_humidifier,
+        }
         
         logger.info("HumidifierScheduler initialized.")
 
@@ -70,69 +82,126 @@ class HumidifierScheduler(DeviceSchedulerBase):
         """
         pass
 
+    def _humidifier_off_composite(self):
+        """
+        Ends a fixed humidifier run: turns the humidifier OFF and returns the fans to default speed.
+
+        Both actions share one scheduled job so they always happen together.
+        """
+        self.humidifier_controller.control_humidifier('off')
+        self.aeration_controller.set_fans_to_default_speed()
+
+    def _activate_humidifier(self, now: datetime):
+        """
+        Starts a fixed-duration humidifier run and schedules its end.
+
+        :param now: The timestamp of the current scheduler tick.
+        :type now: datetime
+        """
+        logger.info("Humidity is below target. Activating humidifier.")
+
+        self.humidifier_controller.control_humidifier(action='on')
+        self.aeration_controller.set_fans_to_max_speed()
+
+        self._humidifier_off_time = now + self._runtime_delta
+        self._next_check_at = None
+        self._schedule_date_job(
+            self._humidifier_off_composite,
+            run_date=self._humidifier_off_time,
+            args=[],
+            job_id='run_humidifier_off'
+        )
+        logger.info(f"Scheduled humidifier to turn OFF at {self._humidifier_off_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def _deactivate_humidifier(self, now: datetime):
+        """
+        Turns the humidifier OFF when humidity has recovered outside of a fixed run.
+
+        :param now: The timestamp of the current scheduler tick.
+        :type now: datetime
+        """
+        logger.info("Humidity is above target. Humidifier not required. Turning OFF.")
+        self.humidifier_controller.control_humidifier(action='off')
+        self.aeration_controller.set_fans_to_default_speed()
+
+    def _log_humidifier_already_running(self, now: datetime):
+        """
+        Handles low humidity while the humidifier is already running.
+
+        :param now: The timestamp of the current scheduler tick.
+        :type now: datetime
+        """
+        logger.info("Humidity is low, but humidifier is already running. No action taken.")
+
+    def _humidifier_noop(self, now: datetime):
+        """
+        Handles every state that requires no action.
+
+        :param now: The timestamp of the current scheduler tick.
+        :type now: datetime
+        """
+
     def check_and_run_humidifier(self):
         """
         Fetches the latest humidity data and controls the humidifier based on
         pre-defined thresholds.
 
         This method is the main entry point for the humidifier's automatic control.
+        If a check is already running on another thread, this call returns at once.
+        """
+        if not self._check_lock.acquire(blocking=False):
+            logger.info("Humidifier check already in progress. Skipping.")
+            return
+        try:
+            self._run_humidifier_check()
+        finally:
+            self._check_lock.release()
+
+    def _run_humidifier_check(self):
+        """
+        Performs one humidifier check; see :meth:`check_and_run_humidifier`.
         """
         logger.info("Checking environmental data for humidifier control.")
+        now = datetime.now()
 
         # 1. Check if a fixed-duration run is in progress
         if self._humidifier_off_time is not None:
-            if datetime.now() < self._humidifier_off_time:
+            if now < self._humidifier_off_time:
                 logger.info("Fixed humidifier run in progress. Skipping humidity check.")
                 return
             else:
                 logger.info("Fixed humidifier run has expired. Resetting state.")
                 self._humidifier_off_time = None
         
+        if self._next_check_at is not None and now < self._next_check_at:
+            logger.info(f"Humidity well above target. Next check after {self._next_check_at.strftime('%H:%M:%S')}.")
+            return
+
         try:
-            sensor_readings = self.sensor_data_queries.get_latest_reading_by_sensor_id(
+            current_humidity = self.sensor_data_queries.get_latest_humidity(
                 sensor_id=self.humidity_sensor_id
             )
 
-            if not sensor_readings or 'raw_data' not in sensor_readings:
-                logger.warning("No latest sensor reading found. Humidifier check aborted.")
-                return
-
-            current_humidity = json.loads(sensor_readings['raw_data']).get('humidity_percentage')
-
             if current_humidity is None:
-                logger.warning("Humidity data not in sensor reading. Humidifier check aborted.")
+                logger.warning("No latest humidity reading found. Humidifier check aborted.")
                 return
 
             logger.info(f"Current vivarium humidity: {current_humidity}%.")
 
-            if current_humidity < (self.target_humidity - self.hysteresis):
-                if not self.humidifier_controller.is_on():
-                    logger.info("Humidity is below target. Activating humidifier.")
-                    
-                    self.humidifier_controller.control_humidifier(action='on')
-                    self.aeration_controller.set_fans_to_max_speed()
-                    
-                    self._humidifier_off_time = datetime.now() + timedelta(minutes=humid_config.runtime)
-                    self._schedule_date_job(
-                        self.humidifier_controller.control_humidifier,
-                        run_date=self._humidifier_off_time,
-                        args=['off'],
-                        job_id='run_humidifier_off'
-                    )
-                    self._schedule_date_job(
-                        self.aeration_controller.set_fans_to_default_speed,
-                        run_date=self._humidifier_off_time,
-                        args=[],
-                        job_id='aeration_default_speed_from_humidifier'
-                    )
-                    logger.info(f"Scheduled humidifier to turn OFF at {self._humidifier_off_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                else:
-                    logger.info("Humidity is low, but humidifier is already running. No action taken.")
-            else:
-                if self.humidifier_controller.is_on() and self._humidifier_off_time is None:
-                    logger.info("Humidity is above target. Humidifier not required. Turning OFF.")
-                    self.humidifier_controller.control_humidifier(action='off')
-                    self.aeration_controller.set_fans_to_default_speed()
-
-        except Exception as e:
+            # 2. Apply the hysteresis rules with a single controller state read
+            activation_point = self.target_humidity - self.hysteresis
+            state = (self.humidifier_controller.is_on() << 1) | (current_humidity < activation_point)
+            self._humidifier_actions.get(state, self._humidifier_noop)(now)
+
+            # 3. When idle, check less often the further humidity is above the activation point
+            if state == 0b00:
+                defer_minutes = min(
+                    CHECK_DEFER_MAX_MINUTES,
+                    max(CHECK_DEFER_MIN_MINUTES, (current_humidity - activation_point) * CHECK_DEFER_MINUTES_PER_PERCENT)
+                )
+                self._next_check_at = now + timedelta(minutes=defer_minutes)
+
+        except (psycopg2.Error, OSError, ValueError) as e:
+            # Database and GPIO failures are expected now and then; anything else propagates
+            # to APScheduler, which logs it with its traceback.
             logger.error(f"Error during automatic humidifier check: {e}")
\ No newline at end of file
@@ -1,82 +1,164 @@
 # vivarium/scheduler/src/light_scheduler.py
 
-import os
-import sys
 from datetime import date, datetime, time,  timedelta
-from apscheduler.schedulers.blocking import BlockingScheduler
-
-# Assuming this file is in vivarium/scheduler/src/
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.combining import OrTrigger
 
 from utilities.src.logger import LogHelper
-from utilities.src.config import LightConfig
+from utilities.src.config import get_light_config
 from utilities.src.db_operations import DBOperations, ConnectionDetails
 from database.climate_data_ops.astro_queries import AstroQueries
 from terrarium.src.controllers.light_controller import LightController
 from scheduler.src.device_scheduler_base import DeviceSchedulerBase # Import the base scheduler
+from scheduler.src.sun_utils import resolve_daily_sunrise_sunset
 
 logger = LogHelper.get_logger(__name__)
 
+#: Maximum number of astro rows kept by :meth:`LightScheduler._get_astro_for_date`.
+ASTRO_CACHE_MAX_ENTRIES = 8
+
 
 class LightScheduler(DeviceSchedulerBase):
     """
     Manages the scheduling of vivarium lights based on astro data or defaults.
     """
-    def __init__(self, scheduler: BlockingScheduler, db_operations: DBOperations, light_controller: LightController):
+    def __init__(self, scheduler: BaseScheduler, db_operations: DBOperations, light_controller: LightController):
         """
         Initializes the LightScheduler.
 
         Args:
-            scheduler (BlockingScheduler): The main APScheduler instance.
+            scheduler (BaseScheduler): The main APScheduler instance (blocking, background or asyncio).
             db_operations (DatabaseOperations): The shared database operations instance.
             light_controller (LightControler): An instance of the LightControler to operate the lights.
         """
         super().__init__(scheduler, db_operations)
-        self.light_config = LightConfig()
+        self.light_config = get_light_config()
         self.light_controller = light_controller
         self.astro_queries = AstroQueries(self.db_operations)
+
+        # Per-day memo of the resolved sunrise/sunset times
+        self._sun_cache_date: date | None = None
+        self._sun_cache: dict | None = None
+
+        # Astro rows already read from the database, keyed by (location_id, forecast_date)
+        self._astro_cache: dict[tuple[int, str], dict] = {}
+
+        # Latest-row fallback per location, tagged with the day (YYYY-MM-DD) it was read on
+        self._latest_astro_cache: dict[int, tuple[str, dict]] = {}
+
+        # (on, off) times of the last schedule applied, so unchanged days can be skipped
+        self._last_schedule: tuple[time, time] | None = None
         logger.info("LightScheduler initialized.")
 
+    def _get_astro_for_date(self, location_id: int, forecast_date: str) -> dict | None:
+        """
+        Returns the sunrise/sunset row for a location and date, or the latest row for
+        the location when that date is missing, reusing earlier lookups.
+
+        Exact-date rows are cached; the cache is cleared once it holds more than
+        :data:`ASTRO_CACHE_MAX_ENTRIES` entries, which keeps just the last few days.
+        A latest-row fallback is reused for the rest of the day it was read on, so a
+        daemon that receives no new astro data does not repeat the fallback query.
+
+        :param location_id: The ID of the location.
+        :type location_id: int
+        :param forecast_date: The date (YYYY-MM-DD) of the astro record.
+        :type forecast_date: str
+        :returns: A dictionary with 'sunrise' and 'sunset', or None if the location has no data.
+        :rtype: dict | None
+        """
+        key = (location_id, forecast_date)
+        astro_data = self._astro_cache.get(key)
+        if astro_data is not None:
+            return astro_data
+
+        day_bucket = datetime.now().strftime('%Y-%m-%d')
+        latest = self._latest_astro_cache.get(location_id)
+        if latest is not None and latest[0] == day_bucket:
+            return latest[1]
+
+        astro_data = self.astro_queries.get_sunrise_sunset_or_latest(location_id, forecast_date)
+        if astro_data and astro_data.get('is_requested_date'):
+            if len(self._astro_cache) >= ASTRO_CACHE_MAX_ENTRIES:
+                self._astro_cache.clear()
+            self._astro_cache[key] = astro_data
+            self._latest_astro_cache.pop(location_id, None)
+        elif astro_data:
+            logger.warning("No astro data found for %s. Using the latest record from %s instead.", forecast_date, astro_data.get('forecast_date'))
+            self._latest_astro_cache[location_id] = (day_bucket, astro_data)
+        return astro_data
+
+    def invalidate_astro_cache(self) -> None:
+        """
+        Drops the cached latest-row fallbacks and today's resolved times.
+
+        Called after new weather data is stored, so the next scheduling pass reads
+        the fresh astro row instead of a fallback cached earlier in the day.
+        Exact-date rows are kept.
+        """
+        self._latest_astro_cache.clear()
+        self._sun_cache_date = None
+        self._sun_cache = None
+        logger.debug("Astro fallback cache cleared.")
+
     def _fetch_sunrise_sunset(self) -> dict:
-        yesterday = (datetime.now().date() - timedelta(days=1)).strftime('%Y-%m-%d')
+        """
+        Returns the sunrise/sunset times to schedule today.
+
+        :returns: A dictionary with 'sunrise_time_to_schedule' and 'sunset_time_to_schedule'.
+        :rtype: dict
+        """
+        return self._fetch_sunrise_sunset_for(datetime.now().date())
+
+    def _fetch_sunrise_sunset_for(self, for_date: date) -> dict:
+        """
+        Resolves the sunrise/sunset times to schedule on a given date.
+
+        Times resolved from the database are memoized for ``for_date``, so repeated
+        scheduling on the same day skips the query and parsing. Fallback times are
+        not memoized, so a later call can still pick up newly fetched astro data.
+
+        :param for_date: The date the lights are being scheduled for.
+        :type for_date: datetime.date
+        :returns: A dictionary with 'sunrise_time_to_schedule' and 'sunset_time_to_schedule'.
+        :rtype: dict
+        """
+        if self._sun_cache_date == for_date:
+            return self._sun_cache
+
         location_id = 1 # Consider making this configurable or dynamic
+        sunrise_time_to_schedule, sunset_time_to_schedule, from_database = resolve_daily_sunrise_sunset(
+            self._get_astro_for_date, self.light_config, location_id, for_date
+        )
 
-        sunrise_time_to_schedule = None
-        sunset_time_to_schedule = None
-
-        try:
-            # Attempt to fetch astro data from DB
-            astro_data = self.astro_queries.get_sunrise_sunset(location_id, yesterday)
-
-            if not astro_data:
-                # 2. If no data for yesterday, try to get the very last record.
-                logger.warning(f"No astro data found for {yesterday}. Attempting to fetch the latest record instead.")
-                astro_data = self.astro_queries.get_latest_sunrise_sunset(location_id)
-            
-            if astro_data and astro_data.get('sunrise') and astro_data.get('sunset'):
-                db_sunrise_str = astro_data['sunrise']
-                db_sunset_str = astro_data['sunset']
-                logger.info(f"Using fetched sunrise/sunset for {yesterday}: Sunrise: {db_sunrise_str}, Sunset: {db_sunset_str}")
-
-                sunrise_time_to_schedule = datetime.strptime(db_sunrise_str.split('\t')[0].strip(), '%I:%M %p').time()
-                sunset_time_to_schedule = datetime.strptime(db_sunset_str.split('\t')[0].strip(), '%I:%M %p').time()
-            else:
-                logger.warning(f"Could not retrieve complete sunrise/sunset data from database for {yesterday}. Using default times from config.")
-                # Fallback to defaults from LightConfig
-                sunrise_time_to_schedule = datetime.strptime(self.light_config.lights_on.split('\t')[0].strip(), '%I:%M %p').time()
-                sunset_time_to_schedule = datetime.strptime(self.light_config.lights_off.split('\t')[0].strip(), '%I:%M %p').time()
-        except Exception as e:
-            logger.error(f"Error fetching/parsing astro data or config defaults: {e}. Using hardcoded fallback times.")
-            # Fallback to hardcoded times if config parsing also fails as a last resort
-            sunrise_time_to_schedule = datetime.strptime("06:00 AM", '%I:%M %p').time()
-            sunset_time_to_schedule = datetime.strptime("06:00 PM", '%I:%M %p').time()
-
-        return {
+        result = {
             'sunrise_time_to_schedule': sunrise_time_to_schedule, 
             'sunset_time_to_schedule': sunset_time_to_schedule
         }
+        if from_database:
+            self._sun_cache_date = for_date
+            self._sun_cache = result
+        return result
+
+    def _apply_light_state(self, on_time: time, off_time: time):
+        """
+        Turns the lights ON if the current time falls in ``[on_time, off_time)``, OFF otherwise.
+
+        Used both for the immediate check when the schedule is updated and by the
+        daily job, which fires at ``on_time`` and at ``off_time``.
+
+        :param on_time: The time of day the lights turn on.
+        :type on_time: datetime.time
+        :param off_time: The time of day the lights turn off.
+        :type off_time: datetime.time
+        """
+        if on_time <= datetime.now().time() < off_time:
+            logger.info("Current time is within the scheduled ON period. Turning lights ON.")
+            self.light_controller.control_light(action='on')
+        else:
+            logger.info("Current time is outside the scheduled ON period. Ensuring lights are OFF.")
+            self.light_controller.control_light(action='off')
 
     def schedule_daily_lights(self):
         """
@@ -109,84 +191,45 @@ class LightScheduler(DeviceSchedulerBase):
         sunset_time_to_schedule = sun_schedule['sunset_time_to_schedule']
 
         if sunrise_time_to_schedule and sunset_time_to_schedule:
+            now = datetime.now()
             # Convert the time object to a full datetime object
-            sunset_datetime = datetime.combine(date.today(), sunset_time_to_schedule)
+            sunset_datetime = datetime.combine(now.date(), sunset_time_to_schedule)
             sunset_datetime_with_offset = sunset_datetime + timedelta(hours=2)
             final_sunset_time = sunset_datetime_with_offset.time()
 
-            # 1. IMMEDIATE STATE CHECK: Turn on or off the light based on the adjusted time.
-            current_time = datetime.now().time()
-            if sunrise_time_to_schedule <= current_time <= final_sunset_time: # Use final_sunset_time here
-                logger.info("Current time is within the scheduled ON period. Turning lights ON.")
-                self.light_controller.control_light(action='on')
+            if (sunrise_time_to_schedule, final_sunset_time) == self._last_schedule:
+                logger.info("Light schedule unchanged (ON at %s, OFF at %s). Skipping update.", sunrise_time_to_schedule, final_sunset_time)
+                return
+
+            # 1. IMMEDIATE STATE CHECK: Turn on or off the light based on the adjusted time,
+            # unless the new schedule leaves the current target state unchanged.
+            if self.light_controller.update_schedule_time(sunrise_time_to_schedule, final_sunset_time):
+                self._apply_light_state(sunrise_time_to_schedule, final_sunset_time)
             else:
-                logger.info("Current time is outside the scheduled ON period. Ensuring lights are OFF.")
-                self.light_controller.control_light(action='off')
-
-            # 2. SCHEDULE CRON JOBS: Now schedule the jobs for future events.
-            self._schedule_cron_job(
-                self.light_controller.control_light,
-                hour=sunrise_time_to_schedule.hour,
-                minute=sunrise_time_to_schedule.minute,
-                second=sunrise_time_to_schedule.second,
-                args=['on'],
-                job_id='lights_on_daily'
+                logger.info("Light state is unchanged by the new schedule. Skipping immediate state check.")
+
+            # 2. SCHEDULE CRON JOB: One job fires at both the ON and OFF times and
+            # re-evaluates the state, so the schedule takes a single jobstore entry.
+            self.scheduler.add_job(
+                self._with_pooled_connection(self._apply_light_state),
+                trigger=OrTrigger([
+                    CronTrigger(
+                        hour=sunrise_time_to_schedule.hour,
+                        minute=sunrise_time_to_schedule.minute,
+                        second=sunrise_time_to_schedule.second
+                    ),
+                    CronTrigger(
+                        hour=final_sunset_time.hour,
+                        minute=final_sunset_time.minute,
+                        second=final_sunset_time.second
+                    )
+                ]),
+                args=[sunrise_time_to_schedule, final_sunset_time],
+                id='lights_daily',
+                name='Daily Lights ON/OFF',
+                replace_existing=True
             )
-            self._schedule_cron_job(
-                self.light_controller.control_light,
-                hour=final_sunset_time.hour,
-                minute=final_sunset_time.minute,
-                second=final_sunset_time.second,
-                args=['off'],
-                job_id='lights_off_daily'
-            )
-            logger.info(f"Daily light schedule set: ON at {sunrise_time_to_schedule.strftime('%H:%M:%S')}, OFF at {final_sunset_time.strftime('%H:%M:%S')}")
+            self._last_schedule = (sunrise_time_to_schedule, final_sunset_time)
+            logger.info("Daily light schedule set: ON at %s, OFF at %s", sunrise_time_to_schedule, final_sunset_time)
         else:
             logger.critical("Failed to determine valid sunrise/sunset times. Light schedule not set.")
-
-
-
-
-        # logger.info("Updating terrarium lights schedule.")
-        
-        # sun_schedule = self._fetch_sunrise_sunset()
-
-        # sunrise_time_to_schedule = sun_schedule['sunrise_time_to_schedule']
-        # sunset_time_to_schedule = sun_schedule['sunset_time_to_schedule']
-
-        # # -- ACTUAL SCHEDULING LOGIC
-        # if sunrise_time_to_schedule and sunset_time_to_schedule:
-        #     # 1. IMMEDIATE STATE CHECK: Turn on or off the light based on the current time.
-        #     current_time = datetime.now().time()
-        #     if sunrise_time_to_schedule <= current_time <= sunset_time_to_schedule:
-        #         logger.info("Current time is within the scheduled ON period. Turning lights ON.")
-        #         self.light_controller.control_light(action='on')
-        #     else:
-        #         logger.info("Current time is outside the scheduled ON period. Ensuring lights are OFF.")
-        #         self.light_controller.control_light(action='off')
-
-        #     # Convert the time object to a full datetime object
-        #     sunset_datetime = datetime.combine(date.today(), sunset_time_to_schedule)
-        #     sunset_datetime_with_offset = sunset_datetime + timedelta(hours=2)
-        #     final_sunset_time = sunset_datetime_with_offset.time()
-
-        #     # 2. SCHEDULE CRON JOBS: Now schedule the jobs for future events.
-        #     self._schedule_cron_job(
-        #         self.light_controller.control_light,
-        #         hour=sunrise_time_to_schedule.hour,
-        #         minute=sunrise_time_to_schedule.minute,
-        #         second=sunrise_time_to_schedule.second,
-        #         args=['on'],
-        #         job_id='lights_on_daily'
-        #     )
-        #     self._schedule_cron_job(
-        #         self.light_controller.control_light,
-        #         hour=final_sunset_time.hour,
-        #         minute=final_sunset_time.minute,
-        #         second=final_sunset_time.second,
-        #         args=['off'],
-        #         job_id='lights_off_daily'
-        #     )
-        #     logger.info(f"Daily light schedule set: ON at {sunrise_time_to_schedule.strftime('%H:%M:%S')}, OFF at {final_sunset_time.strftime('%H:%M:%S')}")
-        # else:
-        #     logger.critical("Failed to determine valid sunrise/sunset times. Light schedule not set.")
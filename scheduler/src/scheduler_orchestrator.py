@@ -4,79 +4,135 @@
 A central orchestrator for managing the lifecycle of background scheduler tasks.
 
 This script reads a configuration file to determine which individual scheduler
-services should be enabled and launched as subprocesses. It is designed to run
-continuously, providing a single point of control for the Vivarium automation system.
+services should be enabled and runs each of them on its own thread within this
+process, retrying in-process if a scheduler cannot be started.
+It is designed to run continuously, providing a single point of control for the
+Vivarium automation system.
 """
 
 import sys
-import subprocess
-import time
+import signal
+import importlib
+import threading
 import logging
-from typing import Dict, List
-from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 
-vivarium_root_path = Path(__file__).resolve().parents[2]
-if str(vivarium_root_path) not in sys.path:
-    sys.path.insert(0, str(vivarium_root_path))
+# When run as a script, put the 'vivarium' directory on sys.path (resolved once in _pathsetup)
+if not __package__:
+    import _pathsetup  # noqa: F401
 
-from utilities.src.config import SchedulerConfig
+from utilities.src.config import get_scheduler_config
 
-#: A dictionary mapping logical scheduler names to their corresponding script filenames.
-SCHEDULER_SCRIPTS = {
-    "weather_fetcher": "scheduler/src/weather_scheduler.py",
-    "vivarium_manager": "scheduler/src/vivarium_scheduler.py",
+#: Maps logical scheduler names to the module and class that implement them.
+SCHEDULER_CLASSES: Dict[str, Tuple[str, str]] = {
+    "weather_fetcher": ("scheduler.src.weather_scheduler", "WeatherScheduler"),
+    "vivarium_manager": ("scheduler.src.vivarium_scheduler", "VivariumScheduler"),
 }
 
-#: A list to track active subprocess objects.
-active_processes: List[subprocess.Popen] = []
+#: First and longest wait, in seconds, before retrying a scheduler that failed to start.
+START_RETRY_INITIAL_DELAY: float = 15.0
+START_RETRY_MAX_DELAY: float = 300.0
 
+#: A list to track (scheduler instance, thread) pairs started in-process.
+active_schedulers: List[Tuple[Any, threading.Thread]] = []
 
-def start_scheduler_process(script_name: str) -> None:
+#: Set by the signal handlers to wake :func:`main` and shut everything down.
+stop_event = threading.Event()
+
+
+def _run_scheduler(name: str) -> None:
     """
-    Starts a given scheduler script as a subprocess.
+    Thread target that builds a scheduler service and runs it until it is shut down.
+
+    If the scheduler class cannot be instantiated (e.g. the database is not up yet),
+    construction is retried in-process with an increasing delay until it succeeds
+    or the orchestrator is stopped.
 
-    :param script_name: The filename of the scheduler script to be launched.
-    :type script_name: str
+    :param name: The logical scheduler name, a key of :data:`SCHEDULER_CLASSES`.
+    :type name: str
     """
+    module_name, class_name = SCHEDULER_CLASSES[name]
     try:
-        process = subprocess.Popen([sys.executable, script_name])
-        active_processes.append(process)
-        print(f"-> Started {script_name} with PID {process.pid}")
-    except FileNotFoundError:
-        logging.error(f"Scheduler script '{script_name}' not found.")
-    except Exception as e:
-        logging.error(f"Error starting {script_name}: {e}")
+        scheduler_cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        logging.error(f"Cannot load {class_name} from {module_name}: {e}")
+        return
+
+    delay = START_RETRY_INITIAL_DELAY
+    while not stop_event.is_set():
+        try:
+            instance = scheduler_cls()
+            break
+        except Exception as e:
+            logging.error(f"Error starting {class_name}: {e}. Retrying in {delay:.0f} seconds.")
+            stop_event.wait(delay)
+            delay = min(delay * 2, START_RETRY_MAX_DELAY)
+    else:
+        return
+
+    active_schedulers.append((instance, threading.current_thread()))
+    print(f"-> Started {class_name} in-process on thread '{name}'")
+    with instance:
+        instance.run()
+
+def start_scheduler(name: str) -> None:
+    """
+    Starts a scheduler service on a daemon thread in this process.
+
+    The scheduler class is imported, instantiated and run on that thread, so no
+    extra interpreter is started and several services initialise concurrently
+    (database connections, boot checks) instead of one after another.
+
+    :param name: The logical scheduler name, a key of :data:`SCHEDULER_CLASSES`.
+    :type name: str
+    """
+    thread = threading.Thread(target=_run_scheduler, args=(name,), name=name, daemon=True)
+    thread.start()
+
+def _request_stop(signum: int, frame) -> None:
+    """
+    Signal handler for SIGINT/SIGTERM that releases the wait in :func:`main`.
+    """
+    print(f"\nSignal {signal.Signals(signum).name} received. Shutting down all schedulers...")
+    stop_event.set()
+
+def shutdown_all() -> None:
+    """
+    Stops every scheduler thread and waits for it to finish.
+    """
+    for instance, thread in active_schedulers:
+        instance.stop()
+        print(f"Stopping scheduler thread '{thread.name}'")
+    for instance, thread in active_schedulers:
+        thread.join()
+    print("All schedulers have been shut down.")
 
 def main() -> None:
     """
     Main function to orchestrate the scheduler services.
     """
     print("--- Starting Scheduler Orchestrator ---")
-    config = SchedulerConfig()
+    config = get_scheduler_config()
 
     print("Checking enabled schedulers...")
 
-    if config.enable_weather_fetch:
-        start_scheduler_process(SCHEDULER_SCRIPTS["weather_fetcher"])
-    
+    # The vivarium manager hosts the weather jobs on its own scheduler, so the
+    # standalone weather fetcher is only needed when climate control is off.
     if config.enable_climate_control:
-        start_scheduler_process(SCHEDULER_SCRIPTS["vivarium_manager"])
+        start_scheduler("vivarium_manager")
+    elif config.enable_weather_fetch:
+        start_scheduler("weather_fetcher")
     
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
     print("\nOrchestrator running. Press Ctrl+C to stop all schedulers.")
-    try:
-        while True:
-            time.sleep(5)
-            
-    except KeyboardInterrupt:
-        print("\nKeyboard interrupt received. Shutting down all schedulers...")
-        for process in active_processes:
-            process.terminate()
-            print(f"Terminating process {process.pid}")
-        for process in active_processes:
-            process.wait()
-        print("All schedulers have been shut down.")
-        sys.exit(0)
+    # Block until a signal handler sets the event; there is nothing to poll in between
+    stop_event.wait()
+
+    shutdown_all()
+    sys.exit(0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+# vivarium/scheduler/src/sun_utils.py
+
+import functools
+from datetime import date, time, timedelta
+from typing import Callable, Optional
+
+from utilities.src.logger import LogHelper
+from utilities.src.config import LightConfig
+
+logger = LogHelper.get_logger(__name__)
+
+#: Last-resort ON/OFF times used when neither the database nor the config can be read.
+FALLBACK_SUNRISE = time(6, 0)
+FALLBACK_SUNSET = time(18, 0)
+
+
+def parse_ampm(value: str) -> time:
+    """
+    Parses a 12-hour clock string such as ``'06:45 AM'`` into a :class:`datetime.time`.
+
+    Anything after the first tab character is ignored, matching the format
+    stored in the astro table. The hour, minute and meridiem are sliced out at
+    fixed offsets from the colon and converted directly to integers, avoiding
+    the regex-driven ``strptime`` path. One- and two-digit hours are accepted; as
+    with ``strptime('%I:%M %p')``, the hour must be 1-12 and the minute 0-59.
+
+    :param value: The time string in ``H:MM AM/PM`` or ``HH:MM AM/PM`` form.
+    :type value: str
+    :returns: The parsed time of day.
+    :rtype: datetime.time
+    :raises ValueError: If the string is not in the expected format or out of range.
+    """
+    value = value.partition('\t')[0].strip()
+    colon = value.index(':')
+    meridiem = value[-2:].upper()
+    if meridiem not in ('AM', 'PM'):
+        raise ValueError(f"Invalid 12-hour time string: {value!r}")
+    hour, minute = int(value[:colon]), int(value[colon + 1:colon + 3])
+    if not (1 <= hour <= 12 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid 12-hour time string: {value!r}")
+    return time(hour % 12 + (12 if meridiem == 'PM' else 0), minute)
+
+
+@functools.lru_cache(maxsize=64)
+def parse_ampm_cached(value: str) -> time:
+    """
+    Memoized :func:`parse_ampm`, keyed by the raw string.
+
+    The configured default ON/OFF strings are parsed only once per process.
+    """
+    return parse_ampm(value)
+
+
+def resolve_daily_sunrise_sunset(
+    astro_lookup: Callable[[int, str], Optional[dict]],
+    light_config: LightConfig,
+    location_id: int,
+    for_date: date
+) -> tuple[time, time, bool]:
+    """
+    Resolves the sunrise/sunset times to schedule on a given date.
+
+    Yesterday's astro record is preferred; ``astro_lookup`` may return the latest
+    record instead when that date is missing. If no usable record is found the
+    configured defaults are used, and the hardcoded :data:`FALLBACK_SUNRISE` /
+    :data:`FALLBACK_SUNSET` if even those cannot be parsed.
+
+    :param astro_lookup: Callable taking ``(location_id, 'YYYY-MM-DD')`` and returning a
+                         dictionary with 'sunrise' and 'sunset' as :class:`datetime.time`, or None.
+    :type astro_lookup: Callable[[int, str], Optional[dict]]
+    :param light_config: The light settings providing the default ON/OFF times.
+    :type light_config: LightConfig
+    :param location_id: The ID of the location.
+    :type location_id: int
+    :param for_date: The date the lights are being scheduled for.
+    :type for_date: datetime.date
+    :returns: The sunrise and sunset times, and whether they came from the database.
+    :rtype: tuple[datetime.time, datetime.time, bool]
+    """
+    yesterday = (for_date - timedelta(days=1)).strftime('%Y-%m-%d')
+    try:
+        # Fetch yesterday's astro data from DB, or the very last record if it is missing
+        astro_data = astro_lookup(location_id, yesterday)
+
+        if astro_data and astro_data.get('sunrise') and astro_data.get('sunset'):
+            # The query already returns datetime.time values, so no parsing is needed
+            sunrise, sunset = astro_data['sunrise'], astro_data['sunset']
+            logger.info("Using fetched sunrise/sunset for %s: Sunrise: %s, Sunset: %s", yesterday, sunrise, sunset)
+            return sunrise, sunset, True
+
+        logger.warning("Could not retrieve complete sunrise/sunset data from database for %s. Using default times from config.", yesterday)
+        # Fallback to defaults from LightConfig
+        return parse_ampm_cached(light_config.lights_on), parse_ampm_cached(light_config.lights_off), False
+    except Exception as e:
+        logger.error("Error fetching/parsing astro data or config defaults: %s. Using hardcoded fallback times.", e)
+        # Fallback to hardcoded times if config parsing also fails as a last resort
+        return FALLBACK_SUNRISE, FALLBACK_SUNSET, False
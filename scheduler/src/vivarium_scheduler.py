@@ -3,37 +3,99 @@
 
 import os
 import sys
-import traceback
+import fcntl
+import atexit
+import logging
+import tempfile
+import threading
+import concurrent.futures
+from typing import TYPE_CHECKING, Optional
 from datetime import time as datetime_time, date, datetime, timedelta
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 from apscheduler.triggers.interval import IntervalTrigger
 
 # --- Path Configuration ---
-# Get the absolute path to the 'vivarium' directory
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# When run as a script, put the 'vivarium' directory on sys.path (resolved once in _pathsetup)
+if not __package__:
+    import _pathsetup  # noqa: F401
 
 # --- Project Imports ---
 from utilities.src.logger import LogHelper
 from utilities.src.db_operations import DBOperations, ConnectionDetails
-from utilities.src.config import SchedulerConfig, TimeConfig, DatabaseConfig
-from terrarium.src.sensors.terrarium_sensor_reader import TerrariumSensorReader
+from utilities.src.config import (SchedulerConfig, TimeConfig, DatabaseConfig, get_scheduler_config,
+                                  get_database_config, get_application_connection_details)
+
+# Controllers, the sensor reader and the device schedulers pull in GPIO, I2C and query
+# modules; they are imported in VivariumScheduler.__init__ so importing this module stays cheap.
+if TYPE_CHECKING:
+    from terrarium.src.sensors.terrarium_sensor_reader import TerrariumSensorReader
+    from terrarium.src.controllers.light_controller import LightController
+    from terrarium.src.controllers.mister_controller import MisterController
+    from terrarium.src.controllers.humidifier_controller import HumidifierController
+    from terrarium.src.controllers.aeration_controller import AerationController
+    from scheduler.src.light_scheduler import LightScheduler
+    from scheduler.src.mister_scheduler import MisterScheduler
+    from scheduler.src.humidifier_scheduler import HumidifierScheduler
+    from scheduler.src.weather_scheduler import WeatherScheduler
 
-# Device Controllers
-from terrarium.src.controllers.light_controller import LightController
-from terrarium.src.controllers.mister_controller import MisterController
-from terrarium.src.controllers.humidifier_controller import HumidifierController
-from terrarium.src.controllers.aeration_controller import AerationController
+logger = LogHelper.get_logger(__name__)
 
-# Schedulers for specific devices
-from scheduler.src.light_scheduler import LightScheduler
-from scheduler.src.mister_scheduler import MisterScheduler
-from scheduler.src.humidifier_scheduler import HumidifierScheduler
+#: Worker threads for scheduler jobs. Jobs are short, blocking GPIO/DB calls, each on
+#: its own pooled connection, so a small pool suffices and bounds concurrent DB use.
+SCHEDULER_MAX_WORKERS: int = 4
+
+#: Pooled DB connections: one per worker thread, plus one for the mister's OFF timer thread.
+SCHEDULER_POOL_SIZE: int = SCHEDULER_MAX_WORKERS + 1
+
+#: Defaults for every job: runs missed while the host slept or the pool was busy are
+#: merged into one, and a run later than the grace period is skipped.
+SCHEDULER_JOB_DEFAULTS: dict = {'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 60}
+
+#: Grace period in seconds for the daily light update, which may still run well after its slot.
+DAILY_JOB_MISFIRE_GRACE_TIME: int = 3600
+
+#: Lock file held for the life of the process that drives the terrarium hardware.
+INSTANCE_LOCK_PATH: str = os.path.join(tempfile.gettempdir(), 'vivarium_scheduler.lock')
+
+#: The open lock file, kept for the life of the process once the lock is taken.
+_instance_lock_file = None
+
+
+class SchedulerAlreadyRunningError(RuntimeError):
+    """Raised when another process already holds the VivariumScheduler instance lock."""
+
+
+def _acquire_instance_lock() -> None:
+    """
+    Takes an exclusive, non-blocking ``flock`` on :data:`INSTANCE_LOCK_PATH`.
+
+    Only one process per host may drive the lights, mister and sensors. The lock is
+    released by the kernel when the process exits, however it exits; a process that
+    already holds it (e.g. the orchestrator retrying construction) may call this again.
+
+    :raises SchedulerAlreadyRunningError: If another process holds the lock.
+    """
+    global _instance_lock_file
+    if _instance_lock_file is not None:
+        return
+    lock_file = open(INSTANCE_LOCK_PATH, 'a+')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.seek(0)
+        holder = lock_file.read().strip() or 'unknown'
+        lock_file.close()
+        raise SchedulerAlreadyRunningError(
+            f"Another VivariumScheduler (pid {holder}) holds {INSTANCE_LOCK_PATH}; not starting a second one."
+        ) from None
+    lock_file.truncate(0)
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    _instance_lock_file = lock_file
 
-logger = LogHelper.get_logger(__name__)
 
 class VivariumScheduler:
     """
@@ -50,28 +112,62 @@ class VivariumScheduler:
         Initializes the VivariumScheduler, its components, and sets up job listeners.
 
         This involves:
-        - Setting up the APScheduler's BlockingScheduler.
+        - Setting up the APScheduler's BackgroundScheduler with a bounded worker pool.
         - Establishing a database connection.
         - Instantiating all necessary device controllers (Light, Mister, Humidifier, etc.).
         - Instantiating the primary sensor reader.
         - Initializing sub-schedulers for specific device management (LightScheduler, MisterScheduler).
         - Performing a critical system boot check to ensure initial safe states and configurations.
+
+        :raises SchedulerAlreadyRunningError: If another process is already running the scheduler.
         """
-        self.scheduler: BlockingScheduler = BlockingScheduler()
+        # Before touching GPIO or the database, make sure no other instance is driving the hardware
+        _acquire_instance_lock()
+
+        self._closed: bool = False
+        try:
+            self._setup()
+        except BaseException:
+            # A partly built instance may already hold GPIO lines and a connection pool
+            self._shutdown()
+            raise
+        # Release GPIO lines and the database even if run() is never reached or never returns
+        atexit.register(self._shutdown)
+
+    def _setup(self) -> None:
+        """
+        Builds the scheduler, database pool, controllers and sub-schedulers; see :meth:`__init__`.
+        """
+        self.scheduler: BackgroundScheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(max_workers=SCHEDULER_MAX_WORKERS)},
+            job_defaults=SCHEDULER_JOB_DEFAULTS
+        )
         self.scheduler.add_listener(self._job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+        self._stop_event = threading.Event()
         logger.info("APScheduler initialized and listener added.")
 
-        self.scheduler_config: SchedulerConfig = SchedulerConfig()
-        self.db_config: DatabaseConfig = DatabaseConfig()
+        self.scheduler_config: SchedulerConfig = get_scheduler_config()
+        self.db_config: DatabaseConfig = get_database_config()
+        self._conn_details: ConnectionDetails = get_application_connection_details()
         self.db_operations: DBOperations = DBOperations()
-        self.db_operations.connect(self._db_connectiondetails())
+        self.db_operations.connect(self._conn_details, pool_size=SCHEDULER_POOL_SIZE)
         logger.info("Database connection established for VivariumScheduler.")
 
+        # Device Controllers
+        from terrarium.src.controllers.light_controller import LightController
+        from terrarium.src.controllers.mister_controller import MisterController
+        from terrarium.src.controllers.humidifier_controller import HumidifierController
+        from terrarium.src.controllers.aeration_controller import AerationController
+        from terrarium.src.sensors.terrarium_sensor_reader import TerrariumSensorReader
+        # Schedulers for specific devices
+        from scheduler.src.light_scheduler import LightScheduler
+        from scheduler.src.mister_scheduler import MisterScheduler
+        from scheduler.src.humidifier_scheduler import HumidifierScheduler
+
         self.light_controller: LightController = LightController(db_operations=self.db_operations)
         self.mister_controller: MisterController = MisterController(db_operations=self.db_operations)
         self.humidifier_controller: HumidifierController = HumidifierController(db_operations=self.db_operations)
         self.aeration_controller: AerationController = AerationController(db_operations=self.db_operations)
-
         logger.info("Device controllers initialized.")
 
         self.terrarium_sensor_reader: TerrariumSensorReader = TerrariumSensorReader(db_operations=self.db_operations)
@@ -95,58 +191,136 @@ class VivariumScheduler:
             humidifier_controller=self.humidifier_controller,
             aeration_controller=self.aeration_controller
         )
+        # The weather fetch shares this APScheduler and connection pool rather than running its own
+        self.weather_scheduler: Optional[WeatherScheduler] = None
+        if self.scheduler_config.enable_weather_fetch:
+            from scheduler.src.weather_scheduler import WeatherScheduler
+            self.weather_scheduler = WeatherScheduler(
+                scheduler=self.scheduler,
+                db_operations=self.db_operations,
+                on_fetched=self.light_scheduler.invalidate_astro_cache
+            )
         logger.info("VivariumScheduler and sub-schedulers initialized.")
 
         self._perform_system_boot_check()
         logger.info("System boot check completed.")
 
-    def __del__(self):
+    def _shutdown(self) -> None:
         """
-        Ensures the database connection is gracefully closed when the VivariumScheduler
-        object is about to be destroyed.
+        Releases the controllers' GPIO lines and closes the database connection.
 
-        This helps prevent resource leaks and ensures data integrity.
+        Called from :meth:`__exit__`, at interpreter exit, and when construction fails
+        part-way; only the first call does anything.
         """
-        if self.db_operations: #and self.db_operations.is_connected():
-            self.db_operations.close()
-            logger.info("Database connection closed by VivariumScheduler (from __del__).")
+        if self._closed:
+            return
+        self._closed = True
+        # After a failed construction only some of these exist
+        for name in ('light_controller', 'mister_controller', 'humidifier_controller', 'aeration_controller'):
+            controller = getattr(self, name, None)
+            if controller is not None:
+                controller.close()
+        db_operations = getattr(self, 'db_operations', None)
+        if db_operations is not None:
+            db_operations.close()
+            logger.info("Database connection closed.")
+
+    def __enter__(self) -> 'VivariumScheduler':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        """
+        Stops the scheduler if it is still running and releases the controllers and database.
+        """
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+        self._shutdown()
 
     def _job_listener(self, event):
         """
         Listener for APScheduler job events (execution and error).
 
-        This method handles logging for job success/failure and implements
-        specific logic, such as retrying failed weather fetches or triggering
-        dependent actions upon job completion.
+        This method only logs job success/failure; follow-up work is chained by the
+        jobs themselves (see :meth:`_read_sensor_data_job`).
 
         :param event: The APScheduler event object containing job details.
         :type event: apscheduler.events.JobEvent
         """
         if event.exception:
-            logger.error(f"Job '{event.job_id}' raised an exception: {event.exception.__class__.__name__}: {event.exception}")
-            logger.error(f"Traceback for job '{event.job_id}':\n{traceback.format_exc()}")
+            # The exception keeps its traceback, so logging formats it only when the record is emitted
+            logger.error("Job '%s' raised an exception: %s: %s", event.job_id,
+                         type(event.exception).__name__, event.exception, exc_info=event.exception)
 
             if event.job_id == 'read_sensor_data':
                 logger.warning("Sensor reading job failed. Skipping humidifier checks to prevent false triggers.")
 
-        else:
-            # Check the result of the job execution
-            result = event.retval
-            logger.info(f"Job '{event.job_id}' completed successfully with result: {result}.")
-        
-            if event.job_id == 'read_sensor_data':
-                logger.info(f"Job '{event.job_id}' finished. Triggering environmental checks for mister.")
-                # self.mister_scheduler.check_and_run_mister()
-                self.humidifier_scheduler.check_and_run_humidifier()
-            elif event.job_id == 'read_sensor_data' and not result:
-                logger.warning("Sensor reading job completed but reported a failure. Humidifier checks skipped.")
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("Job '%s' completed successfully with result: %s.", event.job_id, event.retval)
 
     def _update_lights_job(self) -> None:
         """
         Job method to fetch the latest sunrise/sunset data and update the light schedule.
         """
         logger.info("Executing light schedule update job.")
-        self.light_scheduler.schedule_daily_lights()
+        with self.db_operations.acquire():
+            self.light_scheduler.schedule_daily_lights()
+
+    def _read_sensor_data_job(self) -> bool:
+        """
+        Job method to read the terrarium sensor and store the reading on a pooled connection.
+
+        After a successful read the humidifier check is queued as its own job on the
+        worker pool, so it never runs on a failed or missing reading.
+
+        :returns: True if data was successfully read and stored, False otherwise.
+        :rtype: bool
+        """
+        with self.db_operations.acquire():
+            stored = self.terrarium_sensor_reader.read_and_store_data()
+
+        if stored:
+            self.scheduler.add_job(
+                self._humidifier_check_job,
+                id='humidifier_check',
+                name='Humidifier check (after sensor read)',
+                replace_existing=True
+            )
+        else:
+            logger.warning("Sensor reading job reported a failure. Humidifier checks skipped.")
+        return stored
+
+    def _humidifier_check_job(self) -> None:
+        """
+        Job method to run the automatic humidifier check on a pooled connection.
+        """
+        with self.db_operations.acquire():
+            self.humidifier_scheduler.check_and_run_humidifier()
+
+    def _safe_state(self) -> None:
+        """
+        Switches the mister and humidifier OFF.
+
+        Runs once per process start, before any boot check or schedule, so every
+        device starts from a known state. Each device is handled separately so one
+        failure does not leave the others untouched. The light is not included: its
+        boot check sets it straight to the state the schedule calls for.
+        """
+        logger.info("Ensuring mister and humidifier start OFF.")
+
+        def mister_off() -> None:
+            self.mister_controller.control_mister(action="off")
+            self.mister_controller._update_status(False)
+
+        def humidifier_off() -> None:
+            self.humidifier_controller.control_humidifier(action="off")
+
+        with self.db_operations.acquire():
+            for name, switch_off in (('Mister', mister_off), ('Humidifier', humidifier_off)):
+                try:
+                    switch_off()
+                    logger.info(f"{name} system: Initial state set to OFF.")
+                except Exception as e:
+                    logger.error(f"Error switching {name} OFF during boot: {e}", exc_info=True)
 
     def _perform_system_boot_check(self) -> None:
         """
@@ -154,88 +328,66 @@ class VivariumScheduler:
 
         This method runs only once when the VivariumScheduler is initialized.
         It's responsible for:
-        - Ensuring devices are in a safe initial state (e.g., lights/mister OFF).
+        - Ensuring devices are in a safe initial state (see :meth:`_safe_state`).
         - Setting up initial schedules (e.g., today's light schedule).
         - Performing initial sensor readings to confirm functionality.
         - Catching and logging errors for each component during boot.
+
+        The remaining subsystem checks are independent, so they run concurrently, each on
+        its own pooled database connection, and take as long as the slowest check.
         """
         logger.info("--- Starting System Boot Check ---")
+        self._safe_state()
+        checks = {
+            'Light': self._boot_check_light,
+            'Aeration': self._boot_check_aeration,
+            'Sensor': self._boot_check_sensor,
+        }
+
+        def run_check(check) -> None:
+            with self.db_operations.acquire():
+                check()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SCHEDULER_MAX_WORKERS, thread_name_prefix='boot_check') as executor:
+            futures = {executor.submit(run_check, check): name for name, check in checks.items()}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error during {futures[future]} System boot check: {e}", exc_info=True)
+        logger.info("--- System Boot Check Complete ---")
 
-        # --- Light System Check ---
-        try:
-            logger.info("Checking Light System...")
-            self.light_controller.control_light(action="off")
-            self.light_controller._update_status(False)
-            logger.info("Light system: Ensured initial state is OFF.")
-            self.light_scheduler.schedule_daily_lights()
-            logger.info("Light system: Daily schedule set up and immediate state adjusted based on current time.")
-        except Exception as e:
-            logger.error(f"Error during Light System boot check: {e}", exc_info=True)
-
-        # --- Mister System Check ---
-        try:
-            logger.info("Checking Mister System...")
-            self.mister_controller.control_mister(action="off")
-            self.mister_controller._update_status(False)
-            logger.info("Mister system: Initial state set to OFF.")
-            # self.mister_scheduler.check_and_run_mister()
-            logger.info("Mister system: Current state adjusted based on environmental conditions.")
-        except Exception as e:
-            logger.error(f"Error during Mister System boot check: {e}", exc_info=True)
-
-        # --- Humidifier System Check ---
-        try:
-            logger.info("Checking Humidifier System...")
-            self.humidifier_controller.control_humidifier(action="off")
-            logger.info("Humidifier system: Initial state set to OFF.")
-            # self.humidifier_scheduler.check_and_run_humidifier()
-            logger.info("Humidifier system: Current state adjusted based on environmental conditions.")
-        except Exception as e:
-            logger.error(f"Error during Humidifier System boot check: {e}", exc_info=True)
-
-        # --- Aeration System Check ---
-        try:
-            logger.info("Checking Aeration System...")
-            self.aeration_controller.set_fans_to_default_speed()
-            logger.info("Aeration system: Initial fan speed set to default.")
-        except Exception as e:
-            logger.error(f"Error during Aeration System boot check: {e}", exc_info=True)
-
+    def _boot_check_light(self) -> None:
+        """
+        Boot check for the lights: set up today's schedule, which also switches the light
+        to the state it calls for, in a single write.
 
-        # --- Sensor System Check ---
+        If no schedule could be set, the light is switched OFF instead.
+        """
+        logger.info("Checking Light System...")
         try:
-            logger.info("Checking Sensor Systems...")
-            self.terrarium_sensor_reader.read_and_store_data()
-            logger.info("Sensor systems: Performed initial reading. Check logs for sensor status.")
-        except Exception as e:
-            logger.error(f"Error during Sensor System boot check: {e}", exc_info=True)
-        logger.info("--- System Boot Check Complete ---")
+            self.light_scheduler.schedule_daily_lights()
+        finally:
+            if self.light_controller.on_time is None:
+                logger.warning("Light system: No schedule could be set. Ensuring initial state is OFF.")
+                self.light_controller.control_light(action="off")
+        logger.info("Light system: Daily schedule set up and immediate state adjusted based on current time.")
 
-    def _db_connectiondetails(self) -> ConnectionDetails:
+    def _boot_check_aeration(self) -> None:
         """
-        Creates a ConnectionDetails object for the database connection.
+        Boot check for the fans: set them to their default speed.
+        """
+        logger.info("Checking Aeration System...")
+        self.aeration_controller.set_fans_to_default_speed()
+        logger.info("Aeration system: Initial fan speed set to default.")
 
-        :returns: A ConnectionDetails object with the database connection details.
-        :rtype: ConnectionDetails
+    def _boot_check_sensor(self) -> None:
         """
-        if self.scheduler_config.application_db_type == 'remote':
-            return ConnectionDetails(
-                host=self.db_config.postgres_remote_connection.host,
-                port=self.db_config.postgres_remote_connection.port,
-                user=self.db_config.postgres_remote_connection.user,
-                password=self.db_config.postgres_remote_connection.password,
-                dbname=self.db_config.postgres_remote_connection.dbname,
-                sslmode=None
-            )
-        else:
-            return ConnectionDetails(
-                host=self.db_config.postgres_local_connection.host,
-                port=self.db_config.postgres_local_connection.port,
-                user=self.db_config.postgres_local_connection.user,
-                password=self.db_config.postgres_local_connection.password,
-                dbname=self.db_config.postgres_local_connection.dbname,
-                sslmode=None
-            )
+        Boot check for the sensors: take and store an initial reading.
+        """
+        logger.info("Checking Sensor Systems...")
+        self.terrarium_sensor_reader.read_and_store_data()
+        logger.info("Sensor systems: Performed initial reading. Check logs for sensor status.")
 
     def schedule_jobs(self) -> None:
         """
@@ -246,16 +398,20 @@ class VivariumScheduler:
         - Regular reading and storing of terrarium sensor data.
         """
         logger.info("Scheduling core Vivarium jobs.")
+        cfg = self.scheduler_config
+        light_hour, light_minute, sensor_read_minutes = cfg.schedule_light_hour, cfg.schedule_light_minute, cfg.scheule_sensor_read
 
         # 1. -- At 4:00 AM everyday, fetch last record to adjust and schedule lights --
         self.scheduler.add_job(
             self._update_lights_job,
             'cron',
-            hour = self.scheduler_config.schedule_light_hour,
-            minute = self.scheduler_config.schedule_light_minute,
-            id='update_lights_daily'
+            hour = light_hour,
+            minute = light_minute,
+            id='update_lights_daily',
+            replace_existing=True,
+            misfire_grace_time=DAILY_JOB_MISFIRE_GRACE_TIME
         )
-        logger.info(f"Scheduled light schedule update to run daily at {self.scheduler_config.schedule_light_hour:02d}:{self.scheduler_config.schedule_light_minute:02d}.")
+        logger.info(f"Scheduled light schedule update to run daily at {light_hour:02d}:{light_minute:02d}.")
 
         # 1a. For testing, run light update more frequently
         # self.scheduler.add_job(
@@ -280,12 +436,13 @@ class VivariumScheduler:
 
         # 3. Read sensor status every 5 min, turn on mister if needed
         self.scheduler.add_job(
-            self.terrarium_sensor_reader.read_and_store_data,
+            self._read_sensor_data_job,
             'interval',
-            minutes = self.scheduler_config.scheule_sensor_read,
-            id='read_sensor_data'
+            minutes = sensor_read_minutes,
+            id='read_sensor_data',
+            replace_existing=True
         )
-        logger.info(f"Scheduled Terrarium sensor reading to run every {self.scheduler_config.scheule_sensor_read} minutes.")
+        logger.info(f"Scheduled Terrarium sensor reading to run every {sensor_read_minutes} minutes.")
 
         # 3a. For testing, run sensor reading more frequently
         # self.scheduler.add_job(
@@ -305,34 +462,46 @@ class VivariumScheduler:
         #     id='read_sensor_data'
         # )
 
+        # 4. -- Daily weather fetch, on this scheduler when weather fetching is enabled --
+        if self.weather_scheduler is not None:
+            self.weather_scheduler.schedule_jobs()
+
+    def stop(self) -> None:
+        """
+        Asks :meth:`run` to shut the scheduler down and return. Safe to call from any thread.
+        """
+        self._stop_event.set()
+
     def run(self) -> None:
         """
         Starts the main loop of the Vivarium Scheduler.
+
+        Jobs run on the scheduler's worker pool; the calling thread only blocks
+        until :meth:`stop` is called (or it is interrupted), then waits for running
+        jobs to finish. The controllers and database connection are released when
+        the ``with`` block around the scheduler exits (or at interpreter exit).
         """
         logger.info("Vivarium Scheduler starting main loop.")
         self.schedule_jobs()
 
         try:
             self.scheduler.start()
+            self._stop_event.wait()
         except (KeyboardInterrupt, SystemExit) as e:
             logger.info(f"Vivarium Scheduler stopping gracefully due to {e.__class__.__name__}...")
         except Exception as e:
             logger.critical(f"Vivarium Scheduler encountered a critical error and will stop: {e}", exc_info=True)
         finally:
-            if hasattr(self, 'light_controller') and self.light_controller:
-                self.light_controller.close()
-            if hasattr(self, 'mister_controller') and self.mister_controller:
-                self.mister_controller.close()
-            if hasattr(self, 'humidifier_controller') and self.humidifier_controller:
-                self.humidifier_controller.close()
-
-            # Ensure DB connection is closed even if an unexpected error occurs or on shutdown
-            if hasattr(self, 'db_operations') and self.db_operations and not self.db_operations.conn.closed:
-                self.db_operations.close()
-                logger.info("Database connection closed.")
+            if self.scheduler.running:
+                self.scheduler.shutdown()
             logger.info("Vivarium Scheduler stopped.")
 
 
 if __name__ == "__main__":
-    scheduler = VivariumScheduler()
-    scheduler.run()
\ No newline at end of file
+    try:
+        scheduler = VivariumScheduler()
+    except SchedulerAlreadyRunningError as e:
+        logger.error(str(e))
+        sys.exit(0)
+    with scheduler:
+        scheduler.run()
\ No newline at end of file
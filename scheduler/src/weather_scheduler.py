@@ -1,24 +1,25 @@
 ''' A dedicated scheduler for all climate data-related tasks. '''
 
-import os
-import sys
-import traceback
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
+from apscheduler.jobstores.base import JobLookupError
 
 # --- Path Configuration ---
-# Get the absolute path to the 'vivarium' directory
-vivarium_root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if vivarium_root_path not in sys.path:
-    sys.path.insert(0, vivarium_root_path)
+# When run as a script, put the 'vivarium' directory on sys.path (resolved once in _pathsetup)
+if not __package__:
+    import _pathsetup  # noqa: F401
 
 # --- Project Imports ---
 from utilities.src.logger import LogHelper
 from utilities.src.db_operations import DBOperations, ConnectionDetails
-from utilities.src.config import WeatherAPIConfig, FileConfig, DatabaseConfig, SchedulerConfig
+from utilities.src.config import (WeatherAPIConfig, FileConfig, get_database_config, get_scheduler_config,
+                                  get_application_connection_details)
 from weather.weatherfetch_orchestrator import WeatherFetchOrchestrator
 
 # --- Global Logger Instance ---
@@ -27,35 +28,65 @@ logger = LogHelper.get_logger(__name__)
 # --- Constants ---
 WEATHER_FETCH_HOUR: int = 1
 WEATHER_FETCH_MINUTE: int = 0
+WEATHER_FETCH_JOB_ID: str = 'fetch_weather_daily'
+WEATHER_RETRY_JOB_ID: str = 'weather_fetch_retry'
+#: Upper bound for the exponentially growing delay between weather fetch retries.
+WEATHER_RETRY_MAX_DELAY_MINUTES: int = 24 * 60
+#: The daily fetch and its retry share one worker thread, so they never run concurrently.
+WEATHER_MAX_WORKERS: int = 1
+#: A daily fetch delayed by up to an hour (e.g. a busy host) still runs; overlapping runs are merged.
+WEATHER_JOB_DEFAULTS: dict = {'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600}
 
 
 class WeatherScheduler:
     """
     Dedicated scheduler for orchestrating weather data fetching and processing jobs.
 
-    This scheduler is designed to be run as a standalone service, independent of
-    the main VivariumScheduler.
+    It can run as a standalone service with its own APScheduler and database
+    connection, or attach its jobs to another scheduler's APScheduler and
+    connection pool (see :class:`~scheduler.src.vivarium_scheduler.VivariumScheduler`).
     """
-    def __init__(self):
+    def __init__(self, scheduler: Optional[BaseScheduler] = None, db_operations: Optional[DBOperations] = None,
+                 on_fetched: Optional[Callable[[], None]] = None):
         """
         Initializes the ClimateScheduler and its components.
+
+        :param scheduler: An APScheduler instance to add the weather jobs to. If ``None``,
+                          a dedicated BackgroundScheduler is created and driven by :meth:`run`.
+        :type scheduler: Optional[BaseScheduler]
+        :param db_operations: A connected DBOperations instance to share. If ``None``, a
+                              dedicated connection is opened and closed on exit.
+        :type db_operations: Optional[DBOperations]
+        :param on_fetched: Called after each successful fetch, e.g. to drop cached astro data.
+        :type on_fetched: Optional[Callable[[], None]]
         """
 
-        self.db_config = DatabaseConfig()
+        self.db_config = get_database_config()
 
         self.weather_api_config = WeatherAPIConfig()
         self.file_config = FileConfig()
-        self.db_operations = DBOperations()
-        self.scheduler_config = SchedulerConfig()
-
-        self.db_conn_details: ConnectionDetails = self._db_connectiondetails()
-
-        self.db_operations.connect(self.db_conn_details)
+        self.scheduler_config = get_scheduler_config()
+
+        self._owns_db: bool = db_operations is None
+        if self._owns_db:
+            self.db_operations = DBOperations()
+            self.db_conn_details: ConnectionDetails = get_application_connection_details()
+            # Jobs run on pooled connections, so a retry after a dropped connection gets a fresh one.
+            # The pool keeps all WEATHER_MAX_WORKERS connections open between the daily runs.
+            self.db_operations.connect(self.db_conn_details, pool_size=WEATHER_MAX_WORKERS)
+        else:
+            self.db_operations = db_operations
 
-        self.scheduler: BlockingScheduler = BlockingScheduler()
+        self._owns_scheduler: bool = scheduler is None
+        self.scheduler: BaseScheduler = scheduler if scheduler is not None else BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(max_workers=WEATHER_MAX_WORKERS)},
+            job_defaults=WEATHER_JOB_DEFAULTS
+        )
+        self._stop_event = threading.Event()
         self.orchestrator: WeatherFetchOrchestrator = WeatherFetchOrchestrator(db_operations = self.db_operations,
                                                                                  weather_api_config = self.weather_api_config,
                                                                                  file_config = self.file_config)
+        self._on_fetched = on_fetched
         self.retry_count: int = 0
         self.max_retries: int = self.scheduler_config.max_retry_attempts
         self.retry_interval: int = self.scheduler_config.retry_interval_minutes
@@ -76,37 +107,50 @@ class WeatherScheduler:
         """
         Listener for APScheduler job events (execution and error).
 
+        A failed fetch is retried after ``retry_interval`` minutes, doubling with each
+        consecutive failure (capped at :data:`WEATHER_RETRY_MAX_DELAY_MINUTES`). A pending
+        retry is moved rather than replaced, and a successful fetch resets the count.
+
         :param event: The APScheduler event object.
         :type event: apscheduler.events.JobEvent
         :returns: None
         :rtype: None
         """
+        # On a shared scheduler the listener also sees other schedulers' jobs
+        if event.job_id not in (WEATHER_FETCH_JOB_ID, WEATHER_RETRY_JOB_ID):
+            return
+
         if event.exception:
-            logger.error(f"Climate job '{event.job_id}' raised an exception: {event.exception.__class__.__name__}: {event.exception}")
-            logger.error(f"Traceback for job '{event.job_id}':\n{traceback.format_exc()}")
+            logger.error("Climate job '%s' raised an exception: %s: %s", event.job_id,
+                         type(event.exception).__name__, event.exception)
+            # The listener runs outside the job's except block, so use the traceback APScheduler captured
+            logger.error("Traceback for job '%s':\n%s", event.job_id, event.traceback)
 
             if self.retry_count < self.max_retries:
+                delay_minutes = min(self.retry_interval * 2 ** self.retry_count, WEATHER_RETRY_MAX_DELAY_MINUTES)
                 self.retry_count += 1
-                retry_time = datetime.now() + timedelta(minutes=self.retry_interval)
-                logger.warning(
-                    f"Job '{event.job_id}' failed. Retrying (Attempt {self.retry_count}/{self.max_retries}) "
-                    f"in {self.retry_interval} minutes at {retry_time.strftime('%Y-%m-%d %H:%M:%S')}."
-                )
-                self.scheduler.add_job(
-                    self.orchestrator.fetch_and_store_weather_data,
-                    'date',
-                    run_date=retry_time,
-                    id='weather_fetch_retry',
-                    replace_existing=True
-                )
+                retry_time = datetime.now() + timedelta(minutes=delay_minutes)
+                logger.warning("Job '%s' failed. Retrying (Attempt %d/%d) in %s minutes at %s.",
+                               event.job_id, self.retry_count, self.max_retries, delay_minutes,
+                               retry_time.strftime('%Y-%m-%d %H:%M:%S'))
+                try:
+                    self.scheduler.reschedule_job(WEATHER_RETRY_JOB_ID, trigger='date', run_date=retry_time)
+                except JobLookupError:
+                    self.scheduler.add_job(
+                        self._fetch_and_store_weather_data_job,
+                        'date',
+                        run_date=retry_time,
+                        id=WEATHER_RETRY_JOB_ID
+                    )
             else:
-                logger.critical(
-                    f"Job '{event.job_id}' failed after {self.max_retries} retries. "
-                    "Skipping further attempts for this run."
-                )
-                self.retry_count = 0 
+                logger.critical("Job '%s' failed after %d retries. Skipping further attempts for this run.",
+                                event.job_id, self.max_retries)
+                self.retry_count = 0
         else:
-            logger.info(f"Climate job '{event.job_id}' executed successfully.")
+            self.retry_count = 0
+            logger.info("Climate job '%s' executed successfully.", event.job_id)
+            if self._on_fetched is not None:
+                self._on_fetched()
 
     def _fetch_and_store_weather_data_job(self) -> None:
         """
@@ -116,34 +160,10 @@ class WeatherScheduler:
         :rtype: None
         """
         logger.info("Executing weather data fetch and store job.")
-        self.orchestrator.fetch_and_store_weather_data()
-
-    def _db_connectiondetails(self) -> ConnectionDetails:
-        """
-        Creates a ConnectionDetails object for the database connection.
+        # Takes a pooled connection when the DBOperations is shared with other schedulers
+        with self.db_operations.acquire():
+            self.orchestrator.fetch_and_store_weather_data()
 
-        :returns: A ConnectionDetails object with the database connection details.
-        :rtype: ConnectionDetails
-        """
-        if self.scheduler_config.application_db_type == 'remote':
-            return ConnectionDetails(
-                host=self.db_config.postgres_remote_connection.host,
-                port=self.db_config.postgres_remote_connection.port,
-                user=self.db_config.postgres_remote_connection.user,
-                password=self.db_config.postgres_remote_connection.password,
-                dbname=self.db_config.postgres_remote_connection.dbname,
-                sslmode=None
-            )
-        else:
-            return ConnectionDetails(
-                host=self.db_config.postgres_local_connection.host,
-                port=self.db_config.postgres_local_connection.port,
-                user=self.db_config.postgres_local_connection.user,
-                password=self.db_config.postgres_local_connection.password,
-                dbname=self.db_config.postgres_local_connection.dbname,
-                sslmode=None
-            )
-        
     def schedule_jobs(self) -> None:
         """
         Schedules the core jobs for the climate scheduler.
@@ -157,7 +177,9 @@ class WeatherScheduler:
             'cron',
             hour=WEATHER_FETCH_HOUR,
             minute=WEATHER_FETCH_MINUTE,
-            id='fetch_weather_daily'
+            id=WEATHER_FETCH_JOB_ID,
+            replace_existing=True,
+            misfire_grace_time=WEATHER_JOB_DEFAULTS['misfire_grace_time']
         )
         logger.info(f"Scheduled weather data fetch to run daily at {WEATHER_FETCH_HOUR:02d}:{WEATHER_FETCH_MINUTE:02d}.")
 
@@ -169,9 +191,35 @@ class WeatherScheduler:
         # )
         # logger.info(f"Scheduled Weather fetch scheduler to run immediately (TESTING).")
 
+    def __enter__(self) -> 'WeatherScheduler':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        """
+        Stops the scheduler if it is still running and closes the database connection,
+        unless they were passed in by the caller, who then owns them.
+        """
+        if self._owns_scheduler and self.scheduler.running:
+            self.scheduler.shutdown()
+        if self._owns_db:
+            # close() is a no-op if the connection is already closed
+            self.db_operations.close()
+
+    def stop(self) -> None:
+        """
+        Asks :meth:`run` to shut the scheduler down and return. Safe to call from any thread.
+
+        :returns: None
+        :rtype: None
+        """
+        self._stop_event.set()
+
     def run(self) -> None:
         """
         Starts the main loop of the Climate Scheduler.
+
+        Jobs run on the scheduler's worker thread; the calling thread only blocks
+        until :meth:`stop` is called (or it is interrupted).
         
         :returns: None
         :rtype: None
@@ -180,15 +228,15 @@ class WeatherScheduler:
         self.schedule_jobs()
         try:
             self.scheduler.start()
+            self._stop_event.wait()
         except (KeyboardInterrupt, SystemExit):
             logger.info("Climate Scheduler stopping gracefully.")
         except Exception as e:
             logger.critical(f"Climate Scheduler encountered a critical error: {e}", exc_info=True)
         finally:
-            if self.db_operations and self.db_operations.conn.closed:
-                self.db_operations.close()
-                logger.info("Database connection closed gracefully.")
+            if self.scheduler.running:
+                self.scheduler.shutdown()
 
 if __name__ == "__main__":
-    climate_scheduler = WeatherScheduler()
-    climate_scheduler.run()
\ No newline at end of file
+    with WeatherScheduler() as climate_scheduler:
+        climate_scheduler.run()
\ No newline at end of file
@@ -7,7 +7,7 @@ if __name__ == "__main__":
 """
 
 import os
-from setuptools import setup, find_packages
+from setuptools import setup
 
 def read_requirements(filename='requirements.txt'):
     """Reads requirements from a file."""
@@ -21,10 +21,8 @@ def read_requirements(filename='requirements.txt'):
     except FileNotFoundError:
         return []
 
+# Name, version and package discovery are declared in pyproject.toml.
 setup(
-    name='vivarium_controller',
-    version='0.1.0',
-    packages=find_packages(),
     install_requires=read_requirements(),
     # ... other setup.py arguments ...
 )
\ No newline at end of file
@@ -7,9 +7,11 @@ from typing import Any
 from gpiozero import PWMOutputDevice, DigitalInputDevice
 
 # Path Configuration
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 # Project Imports
 from utilities.src.logger import LogHelper
@@ -103,6 +105,14 @@ class AerationController:
         self.exhaust_fan.cleanup()
         logger.info("AerationController GPIO cleaned up.")
 
+    def close(self) -> None:
+        """
+        Releases the GPIO pins of both fans.
+        """
+        self.intake_fan.close()
+        self.exhaust_fan.close()
+        logger.info("AerationController GPIO released.")
+
 # --- Main block for debugging and testing ---
 if __name__ == '__main__':
     from utilities.src.db_operations import ConnectionDetails, DBOperations
@@ -8,9 +8,11 @@ from datetime import datetime
 from gpiod.line import Direction, Value
 
 # Assuming this file is in vivarium/terrarium/src/controllers
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 from utilities.src.logger import LogHelper
 from utilities.src.db_operations import DBOperations
@@ -175,11 +177,10 @@ class BaseDeviceController:
         elif action == "off":
             desired_state = False
         else:
-            logger.info(f"1: Controlling {self.consumer_name} based on schedule: Current time {datetime.now().strftime('%H:%M')}, ON {start_tm.strftime('%H:%M')}, OFF {stop_tm.strftime('%H:%M')}. Desired state: {desired_state}.")
             if start_tm and stop_tm:
                 now_time = datetime.now().time()
-                is_on_time = start_tm <= now_time < stop_tm
-                desired_state = is_on_time
+                desired_state = start_tm <= now_time < stop_tm
+                logger.info(f"Controlling {self.consumer_name} based on schedule: Current time {now_time.strftime('%H:%M')}, ON {start_tm.strftime('%H:%M')}, OFF {stop_tm.strftime('%H:%M')}. Desired state: {desired_state}.")
             else:
                 logger.warning(f"No valid schedule times provided for {self.consumer_name}. Cannot determine desired state.")
                 return
@@ -9,9 +9,11 @@ from datetime import time as datetime_time, datetime
 from gpiozero import PWMOutputDevice, DigitalInputDevice
 
 # Path Configuration
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 # Project Imports
 from utilities.src.logger import LogHelper
@@ -108,6 +110,14 @@ class FanController:
         self.fan_pwm.value = 0
         self.fan_tach.close()
         logger.info("FanController GPIO cleaned up.")
+
+    def close(self) -> None:
+        """
+        Releases the PWM and tachometer pins. Closing the PWM output also stops the fan.
+        """
+        self.fan_pwm.close()
+        self.fan_tach.close()
+        logger.info("FanController GPIO released.")
     
     def _update_status(self, speed: float, rpm: float) -> None:
         """
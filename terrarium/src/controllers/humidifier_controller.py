@@ -4,9 +4,11 @@ import time
 from typing import Optional
 
 # Get the absolute path to the 'vivarium' directory
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 # Importing VeSync Assets
 from assets.humidifier.src import vesync
@@ -3,21 +3,22 @@
 import os
 import sys
 import argparse
-from datetime import time
+from datetime import datetime, time
 
 # Get the absolute path to the 'vivarium' directory
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 from utilities.src.logger import LogHelper
-from utilities.src.config import LightConfig, DatabaseConfig
+from utilities.src.config import DatabaseConfig, get_light_config
 from utilities.src.db_operations import DBOperations, ConnectionDetails
 from terrarium.src.controllers.base_device_controller import BaseDeviceController
 from gpiod.line import Value
 
 logger = LogHelper.get_logger(__name__)
-light_config = LightConfig()
 
 class LightController(BaseDeviceController):
     """
@@ -35,6 +36,7 @@ class LightController(BaseDeviceController):
                               by a higher-level orchestrator.
         :type db_operations: DBOperations
         """
+        light_config = get_light_config()
         self.device_id = light_config.device_id
         self.relay_pin = int(light_config.lights_control_pin)
         self.consumer_name = 'light_control'  # Unique consumer name for GPIO
@@ -45,7 +47,7 @@ class LightController(BaseDeviceController):
         super().__init__(self.device_id, self.relay_pin, self.consumer_name, db_operations)
         logger.info("LightController initialized.")
 
-    def update_schedule_time(self, on_time: time, off_time: time):
+    def update_schedule_time(self, on_time: time, off_time: time) -> bool:
         """
         Updates the internal on_time and off_time for the light.
 
@@ -56,10 +58,17 @@ class LightController(BaseDeviceController):
         :type on_time: datetime.time
         :param off_time: The time of day to turn the light off.
         :type off_time: datetime.time
+        :returns: True if the light should currently be in a different state under the
+                  new schedule than under the previous one (or no schedule was set before).
+        :rtype: bool
         """
+        now_time = datetime.now().time()
+        was_on = self.on_time <= now_time < self.off_time if self.on_time and self.off_time else None
+
         self.on_time = on_time
         self.off_time = off_time
         logger.info(f"Light schedule times updated: ON at {self.on_time}, OFF at {self.off_time}")
+        return was_on != (on_time <= now_time < off_time)
 
     def control_light(self, action: str = None):
         """
@@ -3,20 +3,30 @@
 import os
 import sys
 import time
+import threading
+import psycopg2
 from datetime import datetime, time as dt_time
+from typing import Callable, Optional
 
 # Get the absolute path to the 'vivarium' directory
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 from utilities.src.logger import LogHelper
-from utilities.src.config import MisterConfig, DatabaseConfig
+from utilities.src.config import DatabaseConfig, SensorConfig, get_mister_config
 from utilities.src.db_operations import DBOperations, ConnectionDetails
 from terrarium.src.controllers.base_device_controller import BaseDeviceController
+from database.sensor_data_ops.sensor_data_queries import SensorDataQueries
 
 logger = LogHelper.get_logger(__name__)
-mister_config = MisterConfig()
+
+#: Retries, and the delay in seconds between them, for the end of a :meth:`MisterController.run_for`
+#: run when recording the OFF status (or the follow-up action) fails.
+MISTER_OFF_MAX_RETRIES: int = 3
+MISTER_OFF_RETRY_SECONDS: float = 30
 
 class MisterController(BaseDeviceController):
     """
@@ -31,6 +41,7 @@ class MisterController(BaseDeviceController):
         :param db_operations: An instance of DBOperations for database interaction.
         :type db_operations: DBOperations
         """
+        mister_config = get_mister_config()
         self.device_id = mister_config.device_id
         self.relay_pin = int(mister_config.mister_control_pin)
         self.consumer_name = 'mister_control'
@@ -38,9 +49,39 @@ class MisterController(BaseDeviceController):
         super().__init__(self.device_id, self.relay_pin, self.consumer_name, db_operations)
         logger.info("MisterController initialized.")
 
+        self._apply_config(mister_config)
+        self.humidity_sensor_id = SensorConfig().THsensorID
+        self._sensor_data_queries = SensorDataQueries(db_operations)
+
+        # Last (timestamp string, parsed datetime) pair seen in control_mister_auto
+        self._last_ts_cache: tuple[str, datetime] | None = None
+
+        # (monotonic time, status) of the latest status read by control_mister_auto. The TTL
+        # stays well below the mister interval and never exceeds five minutes.
+        self._status_cache: tuple[float, dict] | None = None
+
+    def _apply_config(self, mister_config) -> None:
+        """
+        Copies the mister settings used by :meth:`control_mister_auto` onto the instance,
+        so the scheduled checks never go back to the config object.
+
+        :param mister_config: The mister settings to apply.
+        :type mister_config: MisterConfig
+        """
         self.mister_duration = mister_config.duration
         self.mister_interval = mister_config.mister_interval
         self.humidity_threshold = mister_config.humidity_threshold
+        self._status_ttl = min(self.mister_interval * 60 * 0.5, 300)
+
+    def reload_config(self) -> None:
+        """
+        Re-reads the mister settings from the config files and applies the new
+        duration, interval and humidity threshold. The device ID and GPIO pin are
+        fixed for the lifetime of the controller and are not reloaded.
+        """
+        get_mister_config.cache_clear()
+        self._apply_config(get_mister_config())
+        logger.info(f"Mister config reloaded: threshold {self.humidity_threshold}%, interval {self.mister_interval} minutes, duration {self.mister_duration} seconds.")
 
     def run_mister(self, duration: int):
         """
@@ -51,6 +92,7 @@ class MisterController(BaseDeviceController):
         """
         try:
             logger.info(f"Activating mister for {duration} seconds.")
+            self._status_cache = None
             self.toggle_device(action='on')
             time.sleep(duration)
             self.toggle_device(action='off')
@@ -58,6 +100,67 @@ class MisterController(BaseDeviceController):
         except Exception as e:
             logger.error(f"Error during mister run: {e}")
 
+    def run_for(self, duration: int, after_off: Optional[Callable[[], None]] = None) -> threading.Timer:
+        """
+        Turns the mister on and returns immediately, turning it off after ``duration`` seconds.
+
+        Unlike :meth:`run_mister`, the caller's thread is not blocked: the OFF step runs
+        on a :class:`threading.Timer`, so no separate scheduler job is needed for it.
+
+        :param duration: The duration in seconds to run the mister.
+        :type duration: int
+        :param after_off: Optional callable invoked right after the mister is turned off,
+                          e.g. to return the fans to their default speed.
+        :type after_off: Callable[[], None], optional
+        :returns: The started timer, which can be cancelled to keep the mister on.
+        :rtype: threading.Timer
+        """
+        logger.info(f"Activating mister for {duration} seconds.")
+        self._status_cache = None
+        self.toggle_device(action='on')
+        timer = threading.Timer(duration, self._end_run, args=[after_off])
+        timer.name = 'mister_off_timer'
+        timer.start()
+        return timer
+
+    def _end_run(self, after_off: Optional[Callable[[], None]] = None, attempt: int = 0,
+                 status_recorded: bool = False):
+        """
+        Turns the mister off at the end of a :meth:`run_for` run and runs the follow-up action.
+
+        The GPIO pin is driven low before any database access, so a database failure cannot
+        leave the mister running. The OFF status is then recorded on the timer thread's own
+        pooled connection, as a scheduler job would. If that (or ``after_off``) fails, the
+        step is retried on a new timer up to :data:`MISTER_OFF_MAX_RETRIES` times; the last
+        failure is re-raised.
+
+        :param after_off: Optional callable invoked right after the mister is turned off.
+        :type after_off: Callable[[], None], optional
+        :param attempt: The number of retries already made.
+        :type attempt: int
+        :param status_recorded: Whether an earlier attempt already stored the OFF status.
+        :type status_recorded: bool
+        """
+        self._status_cache = None
+        try:
+            self._set_gpio_state(False)
+            with self.db_ops.acquire():
+                if not status_recorded:
+                    self._update_status(False)
+                    status_recorded = True
+                    logger.info("Mister deactivated.")
+                if after_off is not None:
+                    after_off()
+        except Exception as e:
+            if attempt >= MISTER_OFF_MAX_RETRIES:
+                logger.error("Error ending mister run after %d retries: %s", attempt, e)
+                raise
+            logger.warning("Error ending mister run: %s. Retrying in %s seconds.", e, MISTER_OFF_RETRY_SECONDS)
+            timer = threading.Timer(MISTER_OFF_RETRY_SECONDS, self._end_run,
+                                    args=[after_off, attempt + 1, status_recorded])
+            timer.name = 'mister_off_retry_timer'
+            timer.start()
+
     def control_mister(self, action: str):
         """
         Controls the mister based on the provided action ('on', 'off', 'run', or 'status').
@@ -74,13 +177,53 @@ class MisterController(BaseDeviceController):
             if current_status_dict is not None and 'is_on' in current_status_dict:
                 logger.info(f"Current MISTER status: {current_status_dict['is_on']}")
         elif action in ['on', 'off']:
+            self._status_cache = None
             self.toggle_device(action)
         elif action == 'run':
             self.run_mister(duration=self.mister_duration)
         else:
             logger.warning(f"Invalid action '{action}' provided for control_mister. Ignoring.")
 
-    def control_mister_auto(self, current_humidity: float):
+    def _get_status_cached(self) -> dict:
+        """
+        Returns the latest mister status, reusing a recent read for up to the status TTL.
+
+        The cache is dropped whenever this controller switches the mister, since that
+        writes a new status row.
+
+        :return: A dictionary containing the latest device status, or None if not found.
+        :rtype: dict
+        """
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_ttl:
+            return self._status_cache[1]
+        status = self._get_status()
+        self._status_cache = (now, status)
+        return status
+
+    def _parse_last_runtime(self, last_runtime_str) -> datetime:
+        """
+        Converts the timestamp of the latest mister status into a datetime.
+
+        The latest status rarely changes between scheduler ticks, so the last parsed
+        string is remembered and repeat calls skip parsing. Values already
+        returned as :class:`datetime.datetime` by the driver are used as they are.
+
+        :param last_runtime_str: The status timestamp, as ``YYYY-MM-DD HH:MM:SS`` or a datetime.
+        :type last_runtime_str: str | datetime.datetime
+        :returns: The parsed timestamp.
+        :rtype: datetime.datetime
+        :raises ValueError: If the string is not in the expected format.
+        """
+        if isinstance(last_runtime_str, datetime):
+            return last_runtime_str
+        if self._last_ts_cache and self._last_ts_cache[0] == last_runtime_str:
+            return self._last_ts_cache[1]
+        last_runtime = datetime.fromisoformat(last_runtime_str)
+        self._last_ts_cache = (last_runtime_str, last_runtime)
+        return last_runtime
+
+    def control_mister_auto(self, current_humidity: Optional[float] = None):
         """
         Controls the mister automatically based on humidity and interval.
 
@@ -88,15 +231,26 @@ class MisterController(BaseDeviceController):
         current humidity is below the configured threshold and if the last run
         was more than the configured interval ago.
 
-        :param current_humidity: The current humidity reading from a sensor.
-        :type current_humidity: float
+        :param current_humidity: The current humidity reading from a sensor. If omitted, the
+                                 latest reading and the mister's latest status are fetched
+                                 together in a single query.
+        :type current_humidity: float, optional
         """
         try:
+            if current_humidity is None:
+                current_humidity, mister_status = self._sensor_data_queries.get_latest_humidity_and_status(
+                    sensor_id=self.humidity_sensor_id, device_id=self.device_id
+                )
+                if current_humidity is None:
+                    logger.warning("No latest humidity reading found. Mister auto check aborted.")
+                    return
+                self._status_cache = (time.monotonic(), mister_status)
+
             if current_humidity >= self.humidity_threshold:
                 logger.info(f"Current humidity ({current_humidity}%) is above threshold ({self.humidity_threshold}%). Mister not activated.")
                 return
 
-            mister_status = self._get_status()
+            mister_status = self._get_status_cached()
             
             if mister_status and mister_status.get('is_on', False):
                  logger.info("Mister is currently ON. Not checking for auto run.")
@@ -107,21 +261,24 @@ class MisterController(BaseDeviceController):
             run_delta = float('inf')
             if last_runtime_str:
                 try:
-                    last_runtime = datetime.strptime(last_runtime_str, "%Y-%m-%d %H:%M:%S")
+                    last_runtime = self._parse_last_runtime(last_runtime_str)
                     run_delta = (datetime.now() - last_runtime).total_seconds() / 60
                 except (ValueError, TypeError):
                     logger.error(f"Could not parse last_runtime timestamp: {last_runtime_str}. Assuming infinite delta.")
 
             if run_delta >= self.mister_interval:
-                logger.info(f"Humidity is below threshold and interval of {self.mister_interval} minutes met. Running mister.")
+                logger.info("Humidity is below threshold and interval of %s minutes met. Running mister.", self.mister_interval)
                 self.run_mister(self.mister_duration)
             else:
-                logger.info(f"Mister minimum interval duration '{self.mister_interval} minutes' not yet met (last run {round(run_delta, 1)} mins ago). Mister not activated.")
+                logger.info("Mister minimum interval duration '%s minutes' not yet met (last run %.1f mins ago). Mister not activated.",
+                            self.mister_interval, run_delta)
 
-        except Exception as e:
+        except (psycopg2.Error, OSError, ValueError) as e:
+            # Database and GPIO failures are expected now and then; anything else propagates
+            # to the caller with its traceback.
             logger.error(f"Error in automatic mister control: {e}")
 
-def main(action: str, duration: int, humidity: float):
+def main(action: str, duration: int, humidity: Optional[float]):
     """
     Main function to create and run the MisterController.
 
@@ -129,8 +286,8 @@ def main(action: str, duration: int, humidity: float):
     :type action: str
     :param duration: The duration (in seconds) to run the mister.
     :type duration: int
-    :param humidity: The current humidity reading for 'auto' mode.
-    :type humidity: float
+    :param humidity: The current humidity reading for 'auto' mode, or None to read it from the database.
+    :type humidity: float, optional
     """
     db_config = DatabaseConfig()
     db_operations = DBOperations()
@@ -164,8 +321,9 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Control the vivarium mister.")
     parser.add_argument("action", type=str, help="Action to perform: 'run' (manual), 'auto' (automatic), 'on', 'off', or 'status'.")
-    parser.add_argument("--duration", type=int, default=mister_config.mister_duration, help=f"Duration (in seconds) to run the mister (default: {mister_config.mister_duration}s).")
-    parser.add_argument("--humidity", type=float, default=100.0, help="Current humidity reading for 'auto' action (default: 100.0).")
+    mister_config = get_mister_config()
+    parser.add_argument("--duration", type=int, default=mister_config.duration, help=f"Duration (in seconds) to run the mister (default: {mister_config.duration}s).")
+    parser.add_argument("--humidity", type=float, default=None, help="Current humidity reading for 'auto' action (default: latest reading from the database).")
     args = parser.parse_args()
 
     main(args.action, args.duration, args.humidity)
\ No newline at end of file
@@ -4,16 +4,21 @@ import os
 import sys
 import json
 import board
+import atexit
+import threading
 import traceback
 import multiprocessing
+import multiprocessing.connection
 
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
 # Adjust path to ensure utilities are accessible
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 from utilities.src.logger import LogHelper
 from utilities.src.db_operations import DBOperations
@@ -24,6 +29,14 @@ from database.sensor_data_ops.sensor_data_queries import SensorDataQueries
 logger = LogHelper.get_logger(__name__)
 
 TEMPERATURE_UNIT = "\u00B0F"
+#: Seconds a timed-out sensor process gets to exit after SIGTERM before it is sent SIGKILL.
+TERMINATE_GRACE_SECONDS = 2
+
+#: The sensor worker is forked from a small forkserver process (started on the first
+#: read, with this module preloaded) instead of from the scheduler itself, which holds many
+#: threads, GPIO line requests and database connections that a plain fork would copy.
+_MP_CONTEXT = multiprocessing.get_context('forkserver')
+_MP_CONTEXT.set_forkserver_preload([__name__])
 
 class TerrariumSensorReader:
     """
@@ -32,6 +45,9 @@ class TerrariumSensorReader:
     This class handles sensor data retrieval in a separate process to prevent
     the main application from freezing due to I/O timeouts. It then persists
     the data to the database.
+
+    The process is a long-lived worker that opens the I2C bus and sensor once and
+    answers read requests over a pipe; it is only restarted after a timeout or crash.
     """
     def __init__(self, db_operations: DBOperations):
         """
@@ -44,102 +60,220 @@ class TerrariumSensorReader:
         self.sensor_data_queries = SensorDataQueries(db_operations=self.db_ops)
         self.process_timeout = float(TimeConfig().process_term_span)
         self.th_sensor_id = int(coreConfig().thsensor_id)
+
+        self._worker: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn: Optional[multiprocessing.connection.Connection] = None
+        # One request in flight at a time on the worker pipe
+        self._lock = threading.Lock()
+        atexit.register(self.close)
         
         logger.info(f"TerrariumSensorReader initialized with a process timeout of {self.process_timeout} seconds.")
 
     @staticmethod
-    def _fetch_sensor_data_process(queue: multiprocessing.Queue, sensor_id: Optional[int] = 1) -> None:
+    def _create_sensor_device(sensor_id: Optional[int] = 1) -> Any:
         """
-        Helper function to fetche sensor data within a separate process.
-        
-        This static method is the target for the multiprocessing process. It
-        initializes the I2C sensor to avoid pickling issues.
+        Opens the I2C bus and creates the driver object for the configured sensor.
+
+        :param sensor_id: The ID of the sensor to read from.
+        :type sensor_id: Optional[int]
+        :returns: The sensor driver instance.
+        :raises ValueError: If the sensor ID is not supported.
+        """
+        i2c_bus = board.I2C()
+
+        if sensor_id == 1:
+            from adafruit_htu21d import HTU21D
+            return HTU21D(i2c_bus)
+        elif sensor_id == 2:
+            from adafruit_sht4x import SHT4x, Mode
+            sensor_device = SHT4x(i2c_bus)
+            sensor_device.mode = Mode.NOHEAT_HIGHPRECISION
+            return sensor_device
+        elif sensor_id == 3:
+            from adafruit_sht31d import SHT31D
+            sensor_device = SHT31D(i2c_bus)
+            sensor_device.heater = False
+            return sensor_device
+        raise ValueError(f"Unsupported sensor ID: {sensor_id}")
+
+    @staticmethod
+    def _sensor_worker(conn: multiprocessing.connection.Connection, sensor_id: Optional[int] = 1) -> None:
+        """
+        Main loop of the sensor worker process.
+
+        Each message received on ``conn`` requests one reading, which is sent back as a
+        dictionary (or an ``{'error': ..., 'traceback': ...}`` dictionary on failure).
+        The sensor is created in this process to avoid pickling issues, on the first
+        request and again after a failed read. The loop ends on ``None`` or when the
+        parent closes its end of the pipe.
         
-        :param queue: The multiprocessing queue to send data back to the parent process.
-        :type queue: multiprocessing.Queue
+        :param conn: This process's end of the duplex pipe to the parent process.
+        :type conn: multiprocessing.connection.Connection
         :param sensor_id: The ID of the sensor to read from.
         :type sensor_id: Optional[int]
         """
+        sensor_device = None
         try:
-            i2c_bus = board.I2C()
-
-            if sensor_id == 1:
-                from adafruit_htu21d import HTU21D
-                sensor_device = HTU21D(i2c_bus)
-            elif sensor_id == 2:
-                from adafruit_sht4x import SHT4x, Mode
-                sensor_device = SHT4x(i2c_bus)
-                sensor_device.mode = Mode.NOHEAT_HIGHPRECISION
-            elif sensor_id == 3:
-                from adafruit_sht31d import SHT31D
-                sensor_device = SHT31D(i2c_bus)
-                sensor_device.heater = False
+            while True:
+                try:
+                    if conn.recv() is None:
+                        break
+                except EOFError:
+                    break
+
+                try:
+                    if sensor_device is None:
+                        sensor_device = TerrariumSensorReader._create_sensor_device(sensor_id)
+
+                    temp_c = sensor_device.temperature
+                    humidity_p = sensor_device.relative_humidity
+
+                    if temp_c is None or humidity_p is None:
+                        raise ValueError("Sensor returned None values (bad read).")
+
+                    temp_f = (temp_c * 9 / 5) + 32
+
+                    sensor_data = {
+                        'temperature_fahrenheit': round(temp_f, 2),
+                        'temperature_celsius': round(temp_c, 2),
+                        'humidity_percentage': round(humidity_p, 2)
+                    }
+                    conn.send(sensor_data)
+                    logger.debug("Sensor data successfully fetched in worker process.")
+
+                except Exception as e:
+                    logger.error(f"Error in sensor worker process: {e}", exc_info=True)
+                    # Re-create the sensor on the next request in case the bus or device was reset
+                    sensor_device = None
+                    conn.send({"error": str(e), "traceback": traceback.format_exc()})
+        finally:
+            conn.close()
+
+    def _ensure_worker(self) -> multiprocessing.connection.Connection:
+        """
+        Starts the sensor worker process if it is not running.
+
+        :returns: The parent's end of the pipe to the worker.
+        :rtype: multiprocessing.connection.Connection
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stop_worker()
+            parent_conn, child_conn = _MP_CONTEXT.Pipe()
+            self._worker = _MP_CONTEXT.Process(
+                target=TerrariumSensorReader._sensor_worker,
+                args=(child_conn, self.th_sensor_id),
+                name='sensor_worker',
+                daemon=True
+            )
+            logger.info("Starting sensor worker process.")
+            self._worker.start()
+            # Drop the parent's copy of the worker's end so a worker that dies reads as EOF
+            child_conn.close()
+            self._conn = parent_conn
+        return self._conn
+
+    def _stop_worker(self, graceful: bool = False) -> None:
+        """
+        Stops the sensor worker process, if any, and closes the pipe to it.
+
+        :param graceful: Ask the worker to exit before falling back to :meth:`_terminate`.
+        :type graceful: bool
+        """
+        worker, conn = self._worker, self._conn
+        self._worker = self._conn = None
+        if conn is not None:
+            if graceful:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            conn.close()
+        if worker is not None:
+            if graceful:
+                worker.join(timeout=TERMINATE_GRACE_SECONDS)
+            if worker.is_alive():
+                self._terminate(worker)
             else:
-                raise ValueError(f"Unsupported sensor ID: {sensor_id}")
+                worker.join()
+                worker.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the sensor worker process. Safe to call more than once.
+        """
+        with self._lock:
+            self._stop_worker(graceful=True)
+
+    @staticmethod
+    def _terminate(process: multiprocessing.process.BaseProcess) -> None:
+        """
+        Stops a sensor process that has overrun its timeout, and releases it.
 
-            temp_c = sensor_device.temperature
-            humidity_p = sensor_device.relative_humidity
+        The process is sent SIGTERM and given :data:`TERMINATE_GRACE_SECONDS` to exit
+        (the wait blocks on the process sentinel), then SIGKILL. It is always reaped
+        and closed, so no zombie or sentinel descriptor is left behind.
 
-            if temp_c is None or humidity_p is None:
-                raise ValueError("Sensor returned None values (bad read).")
+        :param process: The sensor process to stop.
+        :type process: multiprocessing.process.BaseProcess
+        """
+        process.terminate()
+        process.join(timeout=TERMINATE_GRACE_SECONDS)
+        if process.is_alive():
+            logger.warning(f"Sensor process {process.pid} did not exit on SIGTERM; sending SIGKILL.")
+            process.kill()
+            process.join()
+        process.close()
 
-            temp_f = (temp_c * 9 / 5) + 32
+    def _request_reading(self) -> Optional[Dict]:
+        """
+        Asks the worker process for one reading and waits for the reply.
 
-            sensor_data = {
-                'temperature_fahrenheit': round(temp_f, 2),
-                'temperature_celsius': round(temp_c, 2),
-                'humidity_percentage': round(humidity_p, 2)
-            }
-            queue.put(sensor_data)
-            logger.debug("Sensor data successfully fetched in subprocess.")
+        The wait blocks on the pipe's file descriptor, so it returns as soon as the
+        worker replies or exits. A worker that times out or dies is stopped and is
+        restarted on the next request.
 
-        except Exception as e:
-            logger.error(f"Error in sensor subprocess: {e}", exc_info=True)
-            queue.put({"error": str(e), "traceback": traceback.format_exc()})
+        :returns: The worker's reply, or None if it timed out or exited without replying.
+        :rtype: Optional[Dict]
+        """
+        with self._lock:
+            conn = self._ensure_worker()
+            try:
+                conn.send('read')
+                if not multiprocessing.connection.wait([conn], timeout=self.process_timeout):
+                    self._stop_worker()
+                    logger.error(f"Sensor data retrieval timed out after {self.process_timeout} seconds. Worker process terminated.")
+                    return None
+                return conn.recv()
+            except (EOFError, BrokenPipeError, OSError) as e:
+                self._stop_worker()
+                logger.error(f"Sensor worker process exited without returning data: {e}")
+                return None
 
     def read_and_store_data(self) -> bool:
         """
         Reads and stores temperature and humidity data.
         
-        This method initiates a subprocess to read the sensor. It handles process
+        This method requests a reading from the sensor worker process. It handles
         timeouts and persists the collected data to the database.
         
         :returns: True if data was successfully read and stored, False otherwise.
         :rtype: bool
         """
-        queue = multiprocessing.Queue()
-        process = multiprocessing.Process(
-            target=TerrariumSensorReader._fetch_sensor_data_process,
-            args=(queue, self.th_sensor_id)
-        )
-        
-        logger.info("Starting sensor data retrieval subprocess.")
-        process.start()
-        process.join(timeout=self.process_timeout)
-
-        if process.is_alive():
-            process.terminate()
-            process.join()
-            logger.error(f"Sensor data retrieval timed out after {self.process_timeout} seconds. Process terminated.")
+        sensor_data = self._request_reading()
+        if sensor_data is None:
             return False
 
-        if not queue.empty():
-            sensor_data = queue.get()
-
-            if "error" in sensor_data:
-                logger.error(f"Sensor subprocess reported an error: {sensor_data['error']}\n{sensor_data.get('traceback', 'No traceback provided.')}")
-                return False
+        if "error" in sensor_data:
+            logger.error(f"Sensor worker reported an error: {sensor_data['error']}\n{sensor_data.get('traceback', 'No traceback provided.')}")
+            return False
 
-            timestamp = datetime.now().isoformat()
-            raw_data = json.dumps(sensor_data)
-            self.sensor_data_queries.insert_sensor_reading(self.th_sensor_id, timestamp, raw_data)
+        timestamp = datetime.now().isoformat()
+        raw_data = json.dumps(sensor_data)
+        self.sensor_data_queries.insert_sensor_reading(self.th_sensor_id, timestamp, raw_data)
 
-            log_message = (
-                f"Processed and persisted sensor data: Temperature: {sensor_data['temperature_fahrenheit']:.2f}{TEMPERATURE_UNIT}, "
-                f"Humidity: {sensor_data['humidity_percentage']:.2f}%"
-            )
-            logger.info(log_message)
-            return True
-        else:
-            logger.error("Sensor subprocess finished but did not return any data (queue was empty).")
-            return False
\ No newline at end of file
+        log_message = (
+            f"Processed and persisted sensor data: Temperature: {sensor_data['temperature_fahrenheit']:.2f}{TEMPERATURE_UNIT}, "
+            f"Humidity: {sensor_data['humidity_percentage']:.2f}%"
+        )
+        logger.info(log_message)
+        return True
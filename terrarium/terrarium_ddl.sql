@@ -31,6 +31,9 @@ CREATE INDEX idx_sensor_readings_sensor_id ON sensor_readings (sensor_id);
 -- Index on timestamp for efficient querying of readings by time
 CREATE INDEX idx_sensor_readings_timestamp ON sensor_readings (timestamp);
 
+-- Composite index for "latest reading of a sensor" lookups (e.g. the latest humidity)
+CREATE INDEX idx_sensor_readings_sensor_id_timestamp ON sensor_readings (sensor_id, timestamp DESC);
+
 CREATE INDEX idx_raw_data_temperature ON sensor_readings USING gin ((raw_data -> 'temperature'));
 
 
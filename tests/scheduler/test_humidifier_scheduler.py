@@ -0,0 +1,116 @@
+# vivarium/tests/scheduler/test_humidifier_scheduler.py
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import os
+
+# Adjust sys.path to import modules from the vivarium project
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utilities.src.path_utils import PathUtils
+
+# The module reads its config at import time and pulls in GPIO controllers; an empty
+# secrets file and stand-in controller modules are enough for the decision logic.
+_stub_modules = {
+    name: MagicMock()
+    for name in ('terrarium.src.controllers.humidifier_controller', 'terrarium.src.controllers.aeration_controller')
+    if name not in sys.modules
+}
+sys.modules.update(_stub_modules)
+try:
+    with patch.object(PathUtils, 'get_config_secrets_path', return_value=Path(os.devnull)):
+        from scheduler.src.humidifier_scheduler import HumidifierScheduler
+finally:
+    for _name in _stub_modules:
+        del sys.modules[_name]
+
+
+class TestHumidifierScheduler(unittest.TestCase):
+    """
+    Unit tests for the humidifier decision table in :meth:`HumidifierScheduler.check_and_run_humidifier`.
+
+    The activation point is 75% (target 80%, hysteresis 5%).
+    """
+
+    def setUp(self):
+        self.scheduler = MagicMock()
+        self.humidifier_controller = MagicMock()
+        self.aeration_controller = MagicMock()
+        self.humidifier_scheduler = HumidifierScheduler(
+            scheduler=self.scheduler,
+            db_operations=MagicMock(),
+            humidifier_controller=self.humidifier_controller,
+            aeration_controller=self.aeration_controller
+        )
+        self.humidifier_scheduler.target_humidity = 80
+        self.humidifier_scheduler.hysteresis = 5
+        self.humidifier_scheduler.sensor_data_queries = MagicMock()
+
+    def _check(self, humidity, is_on):
+        self.humidifier_scheduler.sensor_data_queries.get_latest_humidity.return_value = humidity
+        self.humidifier_controller.is_on.return_value = is_on
+        self.humidifier_scheduler.check_and_run_humidifier()
+
+    def test_low_humidity_while_off_starts_a_fixed_run(self):
+        self._check(humidity=70.0, is_on=False)
+
+        self.humidifier_controller.control_humidifier.assert_called_once_with(action='on')
+        self.aeration_controller.set_fans_to_max_speed.assert_called_once()
+        self.assertIsNotNone(self.humidifier_scheduler._humidifier_off_time)
+        self.assertEqual(self.scheduler.add_job.call_args.kwargs['id'], 'run_humidifier_off')
+
+    def test_low_humidity_while_on_takes_no_action(self):
+        self._check(humidity=70.0, is_on=True)
+
+        self.humidifier_controller.control_humidifier.assert_not_called()
+        self.scheduler.add_job.assert_not_called()
+
+    def test_recovered_humidity_while_on_turns_off(self):
+        self._check(humidity=85.0, is_on=True)
+
+        self.humidifier_controller.control_humidifier.assert_called_once_with(action='off')
+        self.aeration_controller.set_fans_to_default_speed.assert_called_once()
+
+    def test_high_humidity_while_off_defers_next_check(self):
+        before = datetime.now()
+        self._check(humidity=90.0, is_on=False)
+
+        self.humidifier_controller.control_humidifier.assert_not_called()
+        # 15% above the activation point at 0.5 minutes per percent
+        deferred = self.humidifier_scheduler._next_check_at - before
+        self.assertGreaterEqual(deferred, timedelta(minutes=7.5))
+        self.assertLess(deferred, timedelta(minutes=7.5, seconds=5))
+
+    def test_deferred_check_skips_the_reading(self):
+        self.humidifier_scheduler._next_check_at = datetime.now() + timedelta(minutes=5)
+        self._check(humidity=70.0, is_on=False)
+
+        self.humidifier_scheduler.sensor_data_queries.get_latest_humidity.assert_not_called()
+
+    def test_fixed_run_in_progress_skips_the_reading(self):
+        self.humidifier_scheduler._humidifier_off_time = datetime.now() + timedelta(minutes=5)
+        self._check(humidity=70.0, is_on=True)
+
+        self.humidifier_scheduler.sensor_data_queries.get_latest_humidity.assert_not_called()
+        self.humidifier_controller.control_humidifier.assert_not_called()
+
+    def test_expired_fixed_run_is_reset_before_the_check(self):
+        self.humidifier_scheduler._humidifier_off_time = datetime.now() - timedelta(seconds=1)
+        self._check(humidity=85.0, is_on=True)
+
+        self.assertIsNone(self.humidifier_scheduler._humidifier_off_time)
+        self.humidifier_controller.control_humidifier.assert_called_once_with(action='off')
+
+    def test_missing_reading_aborts_the_check(self):
+        self._check(humidity=None, is_on=False)
+
+        self.humidifier_controller.is_on.assert_not_called()
+        self.humidifier_controller.control_humidifier.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
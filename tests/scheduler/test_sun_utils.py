@@ -0,0 +1,97 @@
+# vivarium/tests/scheduler/test_sun_utils.py
+import unittest
+from unittest.mock import MagicMock
+from datetime import date, time
+from types import SimpleNamespace
+import sys
+import os
+
+# Adjust sys.path to import modules from the vivarium project
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from scheduler.src.sun_utils import (parse_ampm, resolve_daily_sunrise_sunset,
+                                     FALLBACK_SUNRISE, FALLBACK_SUNSET)
+
+
+class TestParseAmpm(unittest.TestCase):
+    """
+    Unit tests for the hand-written 12-hour clock parser.
+    """
+
+    def test_parses_morning_and_evening_times(self):
+        self.assertEqual(parse_ampm('06:45 AM'), time(6, 45))
+        self.assertEqual(parse_ampm('6:05 PM'), time(18, 5))
+        self.assertEqual(parse_ampm('07:12 pm'), time(19, 12))
+
+    def test_midnight_and_noon(self):
+        self.assertEqual(parse_ampm('12:00 AM'), time(0, 0))
+        self.assertEqual(parse_ampm('12:30 PM'), time(12, 30))
+
+    def test_ignores_text_after_tab(self):
+        self.assertEqual(parse_ampm('05:58 AM\tIST'), time(5, 58))
+
+    def test_rejects_malformed_strings(self):
+        for value in ('05:30', '0530 AM', 'sunrise', ''):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_ampm(value)
+
+    def test_rejects_out_of_range_values(self):
+        # strptime('%I:%M %p') rejects these, and so must the fast path
+        for value in ('13:00 PM', '00:30 AM', '05:60 AM'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_ampm(value)
+
+
+class TestResolveDailySunriseSunset(unittest.TestCase):
+    """
+    Unit tests for the database -> config -> hardcoded fallback chain.
+    """
+
+    def setUp(self):
+        self.light_config = SimpleNamespace(lights_on='07:00 AM', lights_off='08:30 PM')
+        self.for_date = date(2025, 6, 2)
+
+    def test_uses_database_times_for_yesterday(self):
+        astro_lookup = MagicMock(return_value={'sunrise': time(5, 58), 'sunset': time(19, 1)})
+
+        result = resolve_daily_sunrise_sunset(astro_lookup, self.light_config, 1, self.for_date)
+
+        self.assertEqual(result, (time(5, 58), time(19, 1), True))
+        astro_lookup.assert_called_once_with(1, '2025-06-01')
+
+    def test_falls_back_to_config_when_no_record(self):
+        astro_lookup = MagicMock(return_value=None)
+
+        result = resolve_daily_sunrise_sunset(astro_lookup, self.light_config, 1, self.for_date)
+
+        self.assertEqual(result, (time(7, 0), time(20, 30), False))
+
+    def test_falls_back_to_config_when_record_is_incomplete(self):
+        astro_lookup = MagicMock(return_value={'sunrise': time(5, 58), 'sunset': None})
+
+        result = resolve_daily_sunrise_sunset(astro_lookup, self.light_config, 1, self.for_date)
+
+        self.assertEqual(result, (time(7, 0), time(20, 30), False))
+
+    def test_falls_back_to_hardcoded_times_when_lookup_fails(self):
+        astro_lookup = MagicMock(side_effect=RuntimeError("connection lost"))
+
+        result = resolve_daily_sunrise_sunset(astro_lookup, self.light_config, 1, self.for_date)
+
+        self.assertEqual(result, (FALLBACK_SUNRISE, FALLBACK_SUNSET, False))
+
+    def test_falls_back_to_hardcoded_times_when_config_is_invalid(self):
+        astro_lookup = MagicMock(return_value=None)
+        light_config = SimpleNamespace(lights_on='13:00 PM', lights_off='08:30 PM')
+
+        result = resolve_daily_sunrise_sunset(astro_lookup, light_config, 1, self.for_date)
+
+        self.assertEqual(result, (FALLBACK_SUNRISE, FALLBACK_SUNSET, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
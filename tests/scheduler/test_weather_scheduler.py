@@ -0,0 +1,117 @@
+# vivarium/tests/scheduler/test_weather_scheduler.py
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import sys
+import os
+
+# Adjust sys.path to import modules from the vivarium project
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from apscheduler.jobstores.base import JobLookupError
+
+from scheduler.src.weather_scheduler import (WeatherScheduler, WEATHER_FETCH_JOB_ID, WEATHER_RETRY_JOB_ID,
+                                             WEATHER_RETRY_MAX_DELAY_MINUTES)
+
+NOW = datetime(2025, 6, 2, 1, 0, 0)
+
+
+class TestWeatherSchedulerRetry(unittest.TestCase):
+    """
+    Unit tests for the retry backoff in :meth:`WeatherScheduler._job_listener`.
+    """
+
+    @patch('scheduler.src.weather_scheduler.WeatherFetchOrchestrator')
+    @patch('scheduler.src.weather_scheduler.FileConfig')
+    @patch('scheduler.src.weather_scheduler.WeatherAPIConfig')
+    @patch('scheduler.src.weather_scheduler.get_database_config')
+    @patch('scheduler.src.weather_scheduler.get_scheduler_config')
+    def setUp(self, mock_get_scheduler_config, *_):
+        mock_get_scheduler_config.return_value = SimpleNamespace(max_retry_attempts=3, retry_interval_minutes=10)
+        self.scheduler = MagicMock()
+        self.on_fetched = MagicMock()
+        self.weather_scheduler = WeatherScheduler(
+            scheduler=self.scheduler,
+            db_operations=MagicMock(),
+            on_fetched=self.on_fetched
+        )
+
+        datetime_patcher = patch('scheduler.src.weather_scheduler.datetime')
+        self.addCleanup(datetime_patcher.stop)
+        datetime_patcher.start().now.return_value = NOW
+
+    def _fail(self, job_id=WEATHER_FETCH_JOB_ID):
+        self.weather_scheduler._job_listener(
+            SimpleNamespace(job_id=job_id, exception=RuntimeError("API down"), traceback="Traceback ...")
+        )
+
+    def _succeed(self, job_id=WEATHER_FETCH_JOB_ID):
+        self.weather_scheduler._job_listener(SimpleNamespace(job_id=job_id, exception=None, traceback=None))
+
+    def _retry_delays(self):
+        return [c.kwargs['run_date'] - NOW for c in self.scheduler.reschedule_job.call_args_list]
+
+    def test_failure_reschedules_the_pending_retry(self):
+        self._fail()
+
+        self.scheduler.reschedule_job.assert_called_once_with(
+            WEATHER_RETRY_JOB_ID, trigger='date', run_date=NOW + timedelta(minutes=10)
+        )
+        self.scheduler.add_job.assert_not_called()
+        self.assertEqual(self.weather_scheduler.retry_count, 1)
+
+    def test_failure_adds_the_retry_job_when_none_is_pending(self):
+        self.scheduler.reschedule_job.side_effect = JobLookupError(WEATHER_RETRY_JOB_ID)
+
+        self._fail()
+
+        self.assertEqual(self.scheduler.add_job.call_args.kwargs['id'], WEATHER_RETRY_JOB_ID)
+        self.assertEqual(self.scheduler.add_job.call_args.kwargs['run_date'], NOW + timedelta(minutes=10))
+
+    def test_delay_doubles_with_each_consecutive_failure(self):
+        self._fail()
+        self._fail(WEATHER_RETRY_JOB_ID)
+        self._fail(WEATHER_RETRY_JOB_ID)
+
+        self.assertEqual(self._retry_delays(), [timedelta(minutes=m) for m in (10, 20, 40)])
+
+    def test_delay_is_capped(self):
+        self.weather_scheduler.retry_interval = WEATHER_RETRY_MAX_DELAY_MINUTES
+
+        self._fail()
+        self._fail(WEATHER_RETRY_JOB_ID)
+
+        self.assertEqual(self._retry_delays(), [timedelta(minutes=WEATHER_RETRY_MAX_DELAY_MINUTES)] * 2)
+
+    def test_gives_up_after_max_retries_and_resets(self):
+        for _ in range(4):
+            self._fail()
+
+        self.assertEqual(self.scheduler.reschedule_job.call_count, 3)
+        self.assertEqual(self.weather_scheduler.retry_count, 0)
+
+    def test_success_resets_the_backoff_and_notifies(self):
+        self._fail()
+        self._succeed(WEATHER_RETRY_JOB_ID)
+
+        self.assertEqual(self.weather_scheduler.retry_count, 0)
+        self.on_fetched.assert_called_once_with()
+
+        self.scheduler.reschedule_job.reset_mock()
+        self._fail()
+        self.assertEqual(self._retry_delays(), [timedelta(minutes=10)])
+
+    def test_ignores_other_jobs_on_a_shared_scheduler(self):
+        self._fail(job_id='read_sensor_data')
+        self._succeed(job_id='read_sensor_data')
+
+        self.scheduler.reschedule_job.assert_not_called()
+        self.scheduler.add_job.assert_not_called()
+        self.on_fetched.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
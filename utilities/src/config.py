@@ -2,15 +2,19 @@
 import os
 import sys
 import configparser
+import collections
+import functools
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
 # Ensure vivarium root path is in sys.path to resolve imports correctly
 # This block must be at the very top, before other project-specific imports.
 # It allows the script to be run from any directory within the project structure.
-vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if vivarium_path not in sys.path:
-    sys.path.insert(0, vivarium_path)
+# Only needed when run directly as a script; package imports already have the root on sys.path
+if not __package__:
+    vivarium_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    if vivarium_path not in sys.path:
+        sys.path.insert(0, vivarium_path)
 
 from utilities.src.path_utils import PathUtils
 from utilities.src.db_operations import ConnectionDetails
@@ -233,6 +237,16 @@ class DatabaseConfig(Config):
             port                    = self._local_port
         )
 
+@functools.lru_cache(maxsize=1)
+def get_database_config() -> DatabaseConfig:
+    """
+    Returns the process-wide :class:`DatabaseConfig`, loading the config files on first use.
+
+    :returns: The shared DatabaseConfig instance.
+    :rtype: DatabaseConfig
+    """
+    return DatabaseConfig()
+
 class SupabaseConfig(Config):
     """
     A subclass of Config specifically for Supabase settings.
@@ -516,6 +530,26 @@ class LightConfig(Config):
         self.lights_off             = self.get(light_section, 'off', default = "6:00 PM")
         self.device_id              = self.get(light_section, 'device_id', default = 1, target_type = int)
 
+@functools.lru_cache(maxsize=1)
+def get_mister_config() -> MisterConfig:
+    """
+    Returns the process-wide :class:`MisterConfig`, loading the config files on first use.
+
+    :returns: The shared MisterConfig instance.
+    :rtype: MisterConfig
+    """
+    return MisterConfig()
+
+@functools.lru_cache(maxsize=1)
+def get_light_config() -> LightConfig:
+    """
+    Returns the process-wide :class:`LightConfig`, loading the config files on first use.
+
+    :returns: The shared LightConfig instance.
+    :rtype: LightConfig
+    """
+    return LightConfig()
+
 class HumidifierConfig(Config):
     '''
     A subclass for Humidifier Settings
@@ -551,6 +585,10 @@ class SensorConfig(Config):
         self.THsensorID = self.get(sensor_section, 'thsensorid', default = 1, target_type = int)
 
 
+#: Immutable snapshot of the MQTT settings, see :meth:`MQTTConfig.snapshot`.
+MQTTSettings = collections.namedtuple('MQTTSettings', 'broker port username password data_topic command_topic')
+
+
 class MQTTConfig(Config):
     """
     A subclass for MQTT communication
@@ -568,6 +606,22 @@ class MQTTConfig(Config):
         self.DATA_TOPIC             = self.get(mqtt_section, 'DATA_TOPIC_PUB', default = None, target_type = str)
         self.COMMAND_TOPIC          = self.get(mqtt_section, 'COMMAND_TOPIC_SUB', default = None, target_type = str)
 
+    def snapshot(self) -> MQTTSettings:
+        """
+        Returns the loaded MQTT settings as an immutable named tuple.
+
+        :returns: The broker, port, credentials and topics in a single frozen record.
+        :rtype: MQTTSettings
+        """
+        return MQTTSettings(
+            broker                  = self.MQTT_BROKER,
+            port                    = int(self.MQTT_PORT) if self.MQTT_PORT else None,
+            username                = self.MQTT_USERNAME,
+            password                = self.MQTT_PASSWORD,
+            data_topic              = self.DATA_TOPIC,
+            command_topic           = self.COMMAND_TOPIC
+        )
+
 class SchedulerConfig(Config):
     """
     A subclass for managing the enable/disable status of various schedulers.
@@ -591,6 +645,30 @@ class SchedulerConfig(Config):
         self.scheule_sensor_read    = self.get(scheduler_section, 'schedule_sensor_read', default = 5, target_type=int)
         self.pi_version             = self.get(scheduler_section, 'pi_version', default = 0, target_type = int)
 
+@functools.lru_cache(maxsize=1)
+def get_scheduler_config() -> SchedulerConfig:
+    """
+    Returns the process-wide :class:`SchedulerConfig`, loading the config files on first use.
+
+    :returns: The shared SchedulerConfig instance.
+    :rtype: SchedulerConfig
+    """
+    return SchedulerConfig()
+
+@functools.lru_cache(maxsize=1)
+def get_application_connection_details() -> ConnectionDetails:
+    """
+    Returns the application database connection details selected by the scheduler's
+    ``application_db_type`` ('remote' or local), resolved once per process.
+
+    :returns: The shared ConnectionDetails for the application database.
+    :rtype: ConnectionDetails
+    """
+    db_config = get_database_config()
+    if get_scheduler_config().application_db_type == 'remote':
+        return db_config.postgres_remote_connection
+    return db_config.postgres_local_connection
+
 class coreConfig(Config):
     """
     A subclass for core settings
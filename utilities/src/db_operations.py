@@ -1,6 +1,9 @@
 # src/utilities/db_operations.py
 
+import threading
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
 from psycopg2 import sql
 from psycopg2 import OperationalError as Psycopg2Error
 from typing import Optional, List, Dict, Any, Tuple
@@ -11,6 +14,14 @@ from utilities.src.logger import LogHelper
 
 logger = LogHelper.get_logger(__name__)
 
+# Optional faster JSON decoder for jsonb columns such as sensor_readings.raw_data.
+# psycopg2 falls back to the stdlib json module when orjson is not installed.
+try:
+    import orjson
+    _jsonb_loads = orjson.loads
+except ImportError:
+    _jsonb_loads = None
+
 
 @dataclass
 class ConnectionDetails:
@@ -54,8 +65,17 @@ class DBOperations:
         self.conn = None
         self._connection_details: Optional[ConnectionDetails] = None
         self._current_autocommit_state: bool = False
-
-    def connect(self, connection_details: ConnectionDetails) -> None:
+        # Names of the server-side prepared statements that exist on each open connection
+        self._prepared_names: Dict[Any, set] = {}
+        # Serialises the check-then-PREPARE, so two threads never prepare the same name twice
+        self._prepare_lock = threading.Lock()
+        # Optional pool of extra connections handed out by acquire(), and the connection
+        # bound to the current thread while inside an acquire() block
+        self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        self._pool_jsonb_registered: set = set()
+        self._local = threading.local()
+
+    def connect(self, connection_details: ConnectionDetails, pool_size: int = 0) -> None:
         """
         Establishes a connection to the PostgreSQL database using provided ConnectionDetails.
 
@@ -65,6 +85,11 @@ class DBOperations:
 
         :param connection_details: An object containing all parameters required to establish the connection.
         :type connection_details: :class:`ConnectionDetails`
+        :param pool_size: The number of extra connections :meth:`acquire` may hand out to
+                          concurrent threads. They are all opened up front and kept open. With
+                          the default of 0 there is no pool and every caller shares the single
+                          connection.
+        :type pool_size: int
         :raises psycopg2.OperationalError: If a connection to the database fails.
         :raises Exception: For any other unexpected errors during connection.
         :returns: None
@@ -98,7 +123,14 @@ class DBOperations:
             logger.info(f"Attempting to connect as '{db_user}' to database '{db_name}' at {db_host}:{db_port}.")
             self.conn = psycopg2.connect(**connect_params)
             self.conn.autocommit = self._current_autocommit_state
+            if _jsonb_loads is not None:
+                psycopg2.extras.register_default_jsonb(conn_or_curs=self.conn, loads=_jsonb_loads)
             logger.info(f"Successfully connected as '{db_user}' to database '{db_name}'. Autocommit: {self.conn.autocommit}")
+            if pool_size > 0:
+                # minconn == maxconn: putconn() closes connections beyond minconn, so a smaller
+                # minimum would reconnect (and re-PREPARE) after every burst of overlapping jobs
+                self._pool = psycopg2.pool.ThreadedConnectionPool(minconn=pool_size, maxconn=pool_size, **connect_params)
+                logger.info(f"Connection pool of {pool_size} connections created for database '{db_name}'.")
         except Psycopg2Error as e:
             logger.error(f"FATAL: Operational error connecting as '{db_user}' to database '{db_name}' on host '{db_host}'. "
                          f"Please check connection parameters, database existence, and server status. Error: {e}")
@@ -118,6 +150,13 @@ class DBOperations:
         :returns: None
         :rtype: None
         """
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+            self._pool_jsonb_registered.clear()
+            logger.info("Closed all pooled database connections.")
+        self._prepared_names.clear()
+
         if self.conn and not self.conn.closed:
             if not self._current_autocommit_state:
                 try:
@@ -137,6 +176,9 @@ class DBOperations:
         """
         Returns the active psycopg2 database connection.
 
+        Inside an :meth:`acquire` block this is the pooled connection bound to the
+        calling thread; otherwise it is the single shared connection.
+
         This method does NOT attempt to establish a new connection if one is not active.
         The caller is responsible for ensuring :meth:`connect` has been called successfully.
 
@@ -144,11 +186,55 @@ class DBOperations:
         :rtype: psycopg2.connection
         :raises RuntimeError: If there is no active database connection.
         """
+        bound = getattr(self._local, 'conn', None)
+        if bound is not None:
+            return bound
         if not self.conn or self.conn.closed:
             logger.error("No active database connection found. Call connect() first.")
             raise RuntimeError("No active database connection.")
         return self.conn
 
+    @contextmanager
+    def acquire(self):
+        """
+        A context manager that binds a pooled connection to the calling thread for a block of code.
+
+        Every query, prepared statement and transaction issued through this instance by the
+        same thread inside the block uses that connection, so concurrent jobs no longer queue
+        on the single shared connection. The connection is returned to the pool on exit, and
+        the pool rolls back anything left uncommitted; a connection that was lost during the
+        block is dropped, so the next caller gets a new one. Without a pool (see :meth:`connect`),
+        or when the thread already holds a connection, the current connection is used as is.
+
+        ``getconn()`` does not wait for a connection to be returned: when all of them are
+        in use it raises at once, so the pool must be sized for every thread that can
+        hold a connection at the same time.
+
+        :yields: The connection in use for the block.
+        :rtype: psycopg2.connection
+        :raises psycopg2.pool.PoolError: If every pooled connection is already in use.
+        """
+        if self._pool is None or getattr(self._local, 'conn', None) is not None:
+            yield self.get_connection()
+            return
+
+        conn = self._pool.getconn()
+        try:
+            conn.autocommit = self._current_autocommit_state
+            if _jsonb_loads is not None and conn not in self._pool_jsonb_registered:
+                psycopg2.extras.register_default_jsonb(conn_or_curs=conn, loads=_jsonb_loads)
+                self._pool_jsonb_registered.add(conn)
+            self._local.conn = conn
+            yield conn
+        finally:
+            self._local.conn = None
+            self._pool.putconn(conn)
+            # putconn() closes a connection that was lost during the block; forget its
+            # per-connection state as well
+            if conn.closed:
+                self._pool_jsonb_registered.discard(conn)
+                self._prepared_names.pop(conn, None)
+
     def set_autocommit(self, enabled: bool):
         """
         Sets the autocommit mode for the database connection.
@@ -261,8 +347,9 @@ class DBOperations:
         query: str | sql.SQL | sql.Composed,
         params: Optional[Tuple] = None,
         fetch: bool = False,
-        fetch_one: bool = False
-    ) -> Optional[Dict] | Optional[List[Dict]] | None:
+        fetch_one: bool = False,
+        scalar: bool = False
+    ) -> Optional[Dict] | Optional[List[Dict]] | Any:
         """
         Executes a SQL query against the connected PostgreSQL database.
 
@@ -285,7 +372,12 @@ class DBOperations:
         :param fetch_one: If :obj:`True`, fetches only the first row as a dictionary.
                           This parameter takes precedence over `fetch`. Defaults to :obj:`False`.
         :type fetch_one: bool
+        :param scalar: If :obj:`True`, returns only the first column of the first row, without
+                       building a dictionary. This parameter takes precedence over `fetch_one`
+                       and `fetch`. Defaults to :obj:`False`.
+        :type scalar: bool
         :returns:
+            - The first column's value if `scalar` is :obj:`True` and a row is found.
             - A :py:class:`dict` if `fetch_one` is :obj:`True` and a row is found (e.g., ``{'column_name': value}``).
             - A :py:class:`list` of :py:class:`dict` if `fetch_one` is :obj:`False` and `fetch` is :obj:`True`,
               and rows are found (e.g., ``[{'col1': val1}, {'col1': val2}]``).
@@ -294,7 +386,7 @@ class DBOperations:
                 - The query is DDL/DML (no results to fetch).
                 - An error occurs during execution.
                 - No active connection is available.
-        :rtype: Optional[Dict] | Optional[List[Dict]] | None
+        :rtype: Optional[Dict] | Optional[List[Dict]] | Any
         :raises RuntimeError: If there is no active database connection to execute the query.
         :raises psycopg2.Error: If a database-specific error occurs during query execution
                                 (e.g., syntax error, constraint violation).
@@ -311,6 +403,9 @@ class DBOperations:
                 cur.execute(query, params)
 
                 if cur.description:
+                    if scalar:
+                        row = cur.fetchone()
+                        return row[0] if row else None
                     columns = [desc.name for desc in cur.description]
                     if fetch_one:
                         row = cur.fetchone()
@@ -334,6 +429,62 @@ class DBOperations:
             )
             raise
 
+    def execute_prepared(
+        self,
+        name: str,
+        statement: str,
+        params: Tuple = (),
+        fetch: bool = False,
+        fetch_one: bool = False,
+        scalar: bool = False
+    ) -> Optional[Dict] | Optional[List[Dict]] | Any:
+        """
+        Executes a server-side prepared statement, preparing it first if needed.
+
+        The statement is prepared with ``PREPARE`` the first time ``name`` is used on
+        the current connection, so PostgreSQL parses and plans it once. Later calls only
+        send ``EXECUTE`` with the bound parameters. After a reconnect, statements are
+        prepared again on first use. Each pooled connection keeps its own set of
+        prepared statements.
+
+        :param name: The name of the prepared statement. It must be unique per statement text.
+        :type name: str
+        :param statement: The SQL statement, using ``$1``, ``$2``, ... placeholders.
+        :type statement: str
+        :param params: The parameters to bind, in placeholder order.
+        :type params: tuple
+        :param fetch: If :obj:`True`, fetches all available rows as a list of dictionaries.
+        :type fetch: bool
+        :param fetch_one: If :obj:`True`, fetches only the first row as a dictionary.
+        :type fetch_one: bool
+        :param scalar: If :obj:`True`, returns only the first column of the first row.
+        :type scalar: bool
+        :returns: The same results as :meth:`execute_query`.
+        :rtype: Optional[Dict] | Optional[List[Dict]] | Any
+        :raises psycopg2.Error: If a database-specific error occurs while preparing or executing.
+        """
+        try:
+            conn = self.get_connection()
+        except RuntimeError as e:
+            logger.error(f"Cannot execute prepared statement '{name}'. {e}")
+            return None
+
+        with self._prepare_lock:
+            prepared_names = self._prepared_names.setdefault(conn, set())
+            if name not in prepared_names:
+                prepare = sql.SQL("PREPARE {} AS ").format(sql.Identifier(name)) + sql.SQL(statement)
+                self.execute_query(prepare)
+                prepared_names.add(name)
+                logger.debug(f"Prepared statement '{name}' on the current connection.")
+
+        if params:
+            execute = sql.SQL("EXECUTE {} ({})").format(
+                sql.Identifier(name), sql.SQL(', ').join(sql.Placeholder() * len(params))
+            )
+        else:
+            execute = sql.SQL("EXECUTE {}").format(sql.Identifier(name))
+        return self.execute_query(execute, tuple(params), fetch=fetch, fetch_one=fetch_one, scalar=scalar)
+
     def execute_query_with_returning_id(
         self, query: str, params: Optional[tuple] = None
     ) -> Optional[int]:
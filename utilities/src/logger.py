@@ -1,9 +1,11 @@
 # vivarium/utilities/src/logger.py
 
 import os
+import queue
 import types
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 
 from .path_utils import PathUtils
@@ -21,6 +23,10 @@ class LogHelper:
 
     _loggers = {}
     _initialized = False
+    #: The console/file handlers, fed from a queue by :attr:`_listener` on its own thread.
+    _handlers = []
+    _queue_handler = None
+    _listener = None
 
     #: Default name for the log folder relative to the project root.
     _DEFAULT_LOG_FOLDER_NAME = "logs"
@@ -43,6 +49,43 @@ class LogHelper:
         """
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _start_queue_listener(handlers: list) -> None:
+        """
+        Routes root logger records through a queue to ``handlers`` on a listener thread.
+
+        Logging calls then only enqueue the record; formatting and the console/file
+        writes happen on the listener thread, off the callers' threads and locks.
+
+        :param handlers: The handlers that should receive the records.
+        :type handlers: list
+        """
+        root_logger = logging.getLogger()
+        log_queue = queue.SimpleQueue()
+        LogHelper._handlers = handlers
+        LogHelper._queue_handler = QueueHandler(log_queue)
+        root_logger.addHandler(LogHelper._queue_handler)
+        LogHelper._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        LogHelper._listener.start()
+        atexit.register(LogHelper._listener.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=LogHelper._use_direct_handlers)
+
+    @staticmethod
+    def _use_direct_handlers() -> None:
+        """
+        In a forked child, attaches the handlers to the root logger directly.
+
+        The listener thread does not survive a fork, so records queued in the child
+        would never be written.
+        """
+        root_logger = logging.getLogger()
+        if LogHelper._queue_handler in root_logger.handlers:
+            root_logger.removeHandler(LogHelper._queue_handler)
+            for handler in LogHelper._handlers:
+                root_logger.addHandler(handler)
+        LogHelper._listener = None
+
     @staticmethod
     def get_logger(name: str = 'app') -> logging.Logger:
         """
@@ -67,11 +110,12 @@ class LogHelper:
                 root_logger.removeHandler(handler)
 
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handlers = []
 
             if LogHelper._DEFAULT_CONSOLE_LOG_ENABLED:
                 console_handler = logging.StreamHandler()
                 console_handler.setFormatter(formatter)
-                root_logger.addHandler(console_handler)
+                handlers.append(console_handler)
 
             try:
                 project_root = PathUtils.get_project_root()
@@ -86,11 +130,17 @@ class LogHelper:
                     backupCount=LogHelper._DEFAULT_BACKUP_COUNT
                 )
                 file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
+                handlers.append(file_handler)
+                LogHelper._start_queue_listener(handlers)
                 root_logger.info(f"Logging initialized to file: {log_file_path}")
 
             except Exception as e:
-                logging.basicConfig(level=LogHelper._DEFAULT_LOG_LEVEL, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+                if LogHelper._listener is None:
+                    if not handlers:
+                        fallback_handler = logging.StreamHandler()
+                        fallback_handler.setFormatter(formatter)
+                        handlers.append(fallback_handler)
+                    LogHelper._start_queue_listener(handlers)
                 root_logger.error(f"Failed to set up file logging. Falling back to console only. Error: {e}")
             
             LogHelper._initialized = True
@@ -19,6 +19,8 @@ class PathUtils:
     """
 
     _project_root = None  # Cache for the calculated project root path
+    _config_path = None  # Cache for the resolved config.ini path
+    _config_secrets_path = None  # Cache for the resolved config_secrets.ini path
 
     @classmethod
     def get_project_root(cls) -> Path:
@@ -87,7 +89,9 @@ class PathUtils:
         :rtype: Path
         :raises FileNotFoundError: If 'config.ini' is not found.
         """
-        return cls.get_resource_path('config.ini', must_exist=True)
+        if cls._config_path is None:
+            cls._config_path = cls.get_resource_path('config.ini', must_exist=True)
+        return cls._config_path
 
     @classmethod
     def get_config_secrets_path(cls) -> Path:
@@ -98,7 +102,9 @@ class PathUtils:
         :rtype: Path
         :raises FileNotFoundError: If 'config_secrets.ini' is not found.
         """
-        return cls.get_resource_path('config_secrets.ini', must_exist=True)
+        if cls._config_secrets_path is None:
+            cls._config_secrets_path = cls.get_resource_path('config_secrets.ini', must_exist=True)
+        return cls._config_secrets_path
 
     @classmethod
     def get_sql_script_path(cls, relative_path_from_project_root: str) -> Path:
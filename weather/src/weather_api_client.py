@@ -7,6 +7,10 @@ from utilities.src.config import WeatherAPIConfig
 
 logger = LogHelper.get_logger(__name__)
 
+#: Connect and read timeouts in seconds for API requests, so a stalled server cannot hold
+#: the weather scheduler's worker thread indefinitely.
+WEATHER_API_TIMEOUT: tuple = (5, 30)
+
 class WeatherAPIClient:
     """
     Client for interacting with the WeatherAPI.
@@ -24,6 +28,8 @@ class WeatherAPIClient:
         self.api_key = api_config.api_key
         self.base_url = api_config.url
         self.default_location_lat_long = api_config.lat_long
+        # Reuses the TCP/TLS connection across requests (e.g. a retry shortly after a failure)
+        self._session = requests.Session()
 
     def get_historical_data(self, date_str: str, location_latlong: Optional[str] = None) -> Optional[Dict]:
         """
@@ -52,7 +58,7 @@ class WeatherAPIClient:
             logger.info(f"Fetching weather data for {date_str} at default location {self.default_location_lat_long}...")
         
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self._session.get(self.base_url, params=params, timeout=WEATHER_API_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as http_err: